@@ -0,0 +1,288 @@
+import datetime
+import random
+from datetime import date, timedelta
+from math import isqrt
+
+from mdss import alquileres, archivos, bicicletas, cursos, freelance, kanban, recursos, trenes
+
+# Generadores deterministas de datos sinteticos: con la misma escala y semilla
+# producen exactamente el mismo conjunto de datos. La escala n es el numero
+# aproximado de entidades principales de cada dominio (reservas, matriculas,
+# archivos, usos, recursos, viajes, freelancers, tareas); el resto se deriva
+# de ella con proporciones realistas. Las operaciones que imprimen deben
+# ejecutarse con stdout redirigido.
+
+INICIO = date(2024, 1, 1)
+
+CATEGORIAS = [f"categoria-{i:02d}" for i in range(50)]
+
+_PESOS_ZIPF = {}
+
+def elegirZipf(rnd: random.Random, elementos: list, s: float = 1.1):
+    # Pocos elementos muy populares y una cola larga, como categorias o
+    # estaciones reales. Los pesos se cachean por lista y exponente.
+    clave = (id(elementos), len(elementos), s)
+    pesos = _PESOS_ZIPF.get(clave)
+    if pesos is None:
+        pesos = list(_acumular(1 / (i + 1) ** s for i in range(len(elementos))))
+        _PESOS_ZIPF[clave] = pesos
+    return rnd.choices(elementos, cum_weights=pesos)[0]
+
+def _acumular(valores):
+    total = 0.0
+    for valor in valores:
+        total += valor
+        yield total
+
+def generarAlquileres(n: int, semilla: int = 0) -> dict:
+    # n reservas sobre ~sqrt(n) propiedades: cada propiedad acumula mas
+    # reservas a medida que crece el conjunto, que es lo que hace crecer el
+    # coste de propiedadDisponible.
+    rnd = random.Random(semilla)
+    sistema = alquileres.Sistema()
+    usuarios = [alquileres.Usuario(f"usuario-{i}") for i in range(max(1, n // 5))]
+    propiedades = []
+    for i in range(max(1, isqrt(n))):
+        propiedad = usuarios[i % len(usuarios)].registrarPropiedad(alquileres.Propiedad(f"propiedad-{i}", rnd.randint(40, 300)))
+        if rnd.random() < 0.5:
+            inicio_temporada = INICIO + timedelta(days=rnd.randint(0, 300))
+            propiedad.registrarRegla(alquileres.ReglaRangoFechas(rnd.choice([10, 20, 30]), inicio_temporada, inicio_temporada + timedelta(days=60)))
+        if rnd.random() < 0.3:
+            propiedad.registrarRegla(alquileres.ReglaEstanciaProlongada(rnd.choice([5, 10, 15]), rnd.choice([7, 14, 28])))
+        propiedades.append(propiedad)
+    # Las reservas de cada propiedad se generan en orden y sin solaparse.
+    siguiente_libre = {propiedad: INICIO for propiedad in propiedades}
+    for _ in range(n):
+        propiedad = rnd.choice(propiedades)
+        fecha_inicio = siguiente_libre[propiedad] + timedelta(days=rnd.randint(0, 5))
+        fecha_fin = fecha_inicio + timedelta(days=rnd.randint(1, 14))
+        sistema.hacerReserva(rnd.choice(usuarios), propiedad, fecha_inicio, fecha_fin)
+        siguiente_libre[propiedad] = fecha_fin
+    return {"sistema": sistema, "usuarios": usuarios, "propiedades": propiedades, "fin": max(siguiente_libre.values())}
+
+def generarCursos(n: int, semilla: int = 0) -> dict:
+    # n matriculas repartidas entre n / 10 usuarios y n / 50 cursos (mitad
+    # grabados, mitad presenciales con plazas de sobra), con valoraciones.
+    rnd = random.Random(semilla)
+    sistema = cursos.Sistema()
+    usuarios = [sistema.registrarUsuario(cursos.Usuario(f"usuario-{i}", f"usuario{i}@example.com", "-")) for i in range(max(1, n // 10))]
+    lista_cursos = []
+    futuro = date.today() + timedelta(days=365)
+    for i in range(max(2, n // 50)):
+        precio = rnd.randint(10, 200)
+        if i % 2:
+            curso = cursos.CursoPresencial(f"curso-{i}", "-", precio, 10 * n, futuro, rnd.randint(5, 50), rnd.choice([5, 10, 20]))
+        else:
+            curso = cursos.CursoGrabado(f"curso-{i}", "-", precio)
+        lista_cursos.append(sistema.registrarCurso(curso))
+    for _ in range(n):
+        usuario = rnd.choice(usuarios)
+        curso = elegirZipf(rnd, lista_cursos)
+        usuario.matricular(curso, INICIO + timedelta(days=rnd.randint(0, 365)))
+        if rnd.random() < 0.3:
+            curso.registrarValoracion(rnd.randint(1, 5), INICIO + timedelta(days=rnd.randint(0, 365)), "-")
+    return {"sistema": sistema, "usuarios": usuarios, "cursos": lista_cursos}
+
+def generarArchivos(n: int, semilla: int = 0) -> dict:
+    # Un arbol de n archivos por usuario principal con un directorio cada ~10
+    # archivos; los directorios nuevos cuelgan de uno existente al azar, lo
+    # que da profundidades logaritmicas como en un disco real.
+    rnd = random.Random(semilla)
+    propietario = archivos.Usuario("propietario", "propietario@example.com", "-")
+    invitados = [archivos.Usuario(f"invitado-{i}", f"invitado{i}@example.com", "-") for i in range(20)]
+    directorios = [propietario.raiz]
+    lista_archivos = []
+    for i in range(max(1, n // 10)):
+        directorios.append(propietario.crearDirectorio(f"dir-{i}", rnd.choice(directorios)))
+    for i in range(n):
+        archivo = propietario.crearArchivo(f"archivo-{i}.dat", round(rnd.lognormvariate(4, 1.5), 2), rnd.choice(directorios))
+        azar = rnd.random()
+        if azar < 0.1:
+            propietario.compartir(archivo, rnd.choice(invitados))
+        elif azar < 0.15:
+            propietario.hacerPublico(archivo, date.today() + timedelta(days=rnd.randint(-30, 30)))
+        lista_archivos.append(archivo)
+    return {"propietario": propietario, "invitados": invitados, "directorios": directorios, "archivos": lista_archivos}
+
+def generarBicicletas(n: int, semilla: int = 0) -> dict:
+    # n usos completos durante 30 dias entre n / 100 estaciones medio llenas.
+    # Las salidas se concentran en las estaciones populares y en las horas
+    # punta, que es lo que alimenta la analitica de demanda.
+    rnd = random.Random(semilla)
+    sistema = bicicletas.Sistema()
+    estaciones = []
+    for i in range(max(2, n // 100)):
+        estacion = sistema.registrarEstacion(f"estacion-{i}", rnd.randint(20, 40))
+        for j in range(estacion.capacidad // 2):
+            estacion.registrarBicicleta(f"B{i}-{j}")
+        estaciones.append(estacion)
+    abonos = [
+        lambda: bicicletas.AbonoAnual(date.today()),
+        lambda: bicicletas.AbonoPrePago(rnd.randint(10, 100)),
+        lambda: bicicletas.AbonoTuristico(date.today()),
+    ]
+    usuarios = [bicicletas.Usuario(str(i), f"usuario-{i}", "-", f"tarjeta-{i}", rnd.choice(abonos)()) for i in range(max(1, n // 10))]
+    inicio = datetime.datetime(2024, 3, 1)
+    for _ in range(n):
+        origen = elegirZipf(rnd, estaciones, 0.8)
+        if not origen.bicicletaDisponible():
+            continue
+        hora = rnd.choice([7, 8, 8, 9, 13, 17, 18, 18, 19, rnd.randint(0, 23)])
+        retirada = inicio + timedelta(days=rnd.randint(0, 29), hours=hora, minutes=rnd.randint(0, 59))
+        uso = sistema.retirarBicicleta(rnd.choice(usuarios), origen, retirada)
+        devolucion = retirada + timedelta(minutes=rnd.randint(3, 90))
+        destino = elegirZipf(rnd, estaciones, 0.8)
+        while not sistema.devolverBicicleta(uso, destino, devolucion):
+            destino = rnd.choice(estaciones)
+    return {"sistema": sistema, "estaciones": estaciones, "usuarios": usuarios}
+
+def generarRecursos(n: int, semilla: int = 0) -> dict:
+    # n recursos de n / 50 creadores (pocos creadores con muchos recursos) y
+    # 2 n compras registradas en el RegistroCompras, ya consolidadas en el
+    # indice de ganancias.
+    rnd = random.Random(semilla)
+    indice = recursos.IndiceGanancias()
+    creadores = [indice.registrarCreador(recursos.Creador(f"creador-{i}", f"creador{i}@example.com", "-")) for i in range(max(1, n // 50))]
+    usuarios = [recursos.Usuario(f"usuario-{i}", f"usuario{i}@example.com", "-") for i in range(max(1, n // 5))]
+    estrategias = {
+        "normal": recursos.EstrategiaNormal(),
+        "oferta": recursos.EstrategiaOferta(date.today() + timedelta(days=30), 20),
+        "crowd": recursos.EstrategiaCrowdBased(5),
+    }
+    nombres_estrategia = list(estrategias)
+    filas = []
+    lista_recursos = []
+    for i in range(n):
+        creador = elegirZipf(rnd, creadores)
+        nombre_estrategia = rnd.choices(nombres_estrategia, weights=[6, 3, 1])[0]
+        fila = {
+            "creador": creador.email,
+            "descripcion": f"recurso-{i}",
+            "imagen": f"imagen-{i}.png",
+            "url": f"https://example.com/recursos/{i}",
+            "fecha_carga": (INICIO + timedelta(days=rnd.randint(0, 365))).isoformat(),
+            "precio_base": rnd.randint(1, 200),
+            "estrategia": nombre_estrategia,
+        }
+        filas.append(fila)
+        recurso = recursos.Recurso(creador, fila["descripcion"], fila["imagen"], fila["url"], date.fromisoformat(fila["fecha_carga"]), fila["precio_base"], estrategias[nombre_estrategia])
+        creador.agregarRecursoCreado(recurso)
+        lista_recursos.append(recurso)
+    motor = recursos.MotorLiberacion()
+    registro = recursos.RegistroCompras(motor_liberacion=motor)
+    for _ in range(2 * n):
+        registro.registrarCompra(rnd.choice(usuarios), elegirZipf(rnd, lista_recursos, 0.9))
+    registro.consolidar()
+    motor.esperarEntregas()
+    return {
+        "indice": indice, "creadores": creadores, "usuarios": usuarios, "estrategias": estrategias,
+        "filas": filas, "recursos": lista_recursos, "registro": registro, "motor": motor,
+    }
+
+def generarTrenes(n: int, semilla: int = 0) -> dict:
+    # n viajes y n / 4 tareas realizadas durante 2024 en una flota de n / 100
+    # trenes de 5 modelos, cada uno con un plan de 3 a 6 tareas periodicas y
+    # por rodadura que comparten un catalogo de repuestos.
+    rnd = random.Random(semilla)
+    sistema = trenes.SistemaMantenimiento()
+    repuestos = [trenes.Repuesto(f"repuesto-{i}", rnd.randint(10, 500)) for i in range(50)]
+    modelos = []
+    for i in range(5):
+        plan = sistema.registrarPlanMantenimiento(trenes.PlanMantenimiento(f"V{i}.0"))
+        modelo = trenes.Modelo(f"modelo-{i}", None)
+        plan.agregarModelo(modelo)
+        modelo.asignarPlanMantenimiento(plan)
+        for j in range(rnd.randint(3, 6)):
+            piezas = rnd.sample(repuestos, rnd.randint(0, 3))
+            if j % 2:
+                tarea = trenes.TareaPorRodadura(f"TR-{i}-{j}", timedelta(hours=rnd.randint(1, 8)), rnd.randint(100, 1000), piezas, rnd.choice([5000, 10000, 20000]))
+            else:
+                tarea = trenes.TareaPeriodica(f"TP-{i}-{j}", timedelta(hours=rnd.randint(1, 8)), rnd.randint(100, 1000), piezas, timedelta(days=rnd.choice([30, 90, 180])))
+            plan.agregarTarea(tarea)
+        modelos.append(modelo)
+    flota = []
+    for i in range(max(1, n // 100)):
+        tren = trenes.Tren(f"T{i:05d}", rnd.choice(modelos), "Marca", date(2020, 1, 1) + timedelta(days=rnd.randint(0, 1000)), rnd.randint(0, 100000))
+        flota.append(sistema.registrarTren(tren))
+    inicio = trenes.segundosDesdeEpoca(datetime.datetime(2024, 1, 1))
+    anio = 366 * 24 * 3600
+    viajes_por_tren = max(1, n // len(flota))
+    for tren in flota:
+        instantes = sorted(inicio + rnd.random() * anio for _ in range(viajes_por_tren))
+        tren.registrarViajes(instantes, [rnd.uniform(20, 600) for _ in instantes])
+    for _ in range(max(1, n // 4)):
+        tren = rnd.choice(flota)
+        tarea = rnd.choice(tren.modelo.plan_mantenimiento.tareas)
+        tren.registrarTareaRealizada(trenes.TareaRealizada(tarea, INICIO + timedelta(days=rnd.randint(0, 365)), "-"))
+    return {"sistema": sistema, "repuestos": repuestos, "modelos": modelos, "trenes": flota}
+
+def generarFreelance(n: int, semilla: int = 0) -> dict:
+    # n freelancers y n / 10 proyectos abiertos sobre 50 categorias con
+    # popularidad Zipf, con unas 20 ofertas por proyecto; a escala 100000 es
+    # el caso de 100k freelancers x 10k proyectos del emparejamiento.
+    rnd = random.Random(semilla)
+    plataforma = freelance.Plataforma()
+    for i in range(max(1, n // 100)):
+        plataforma.registrar_proyectista(f"proyectista-{i}", f"proyectista{i}@example.com")
+    freelancers = []
+    for i in range(n):
+        categorias = list({elegirZipf(rnd, CATEGORIAS) for _ in range(rnd.randint(1, 4))})
+        freelancer = plataforma.registrar_freelancer(f"freelancer-{i}", f"freelancer{i}@example.com", rnd.randint(10, 120), categorias)
+        freelancer.agregar_puntos(rnd.randint(0, 500))
+        freelancers.append(freelancer)
+    proyectos = []
+    for i in range(max(1, n // 10)):
+        categorias = list({elegirZipf(rnd, CATEGORIAS) for _ in range(rnd.randint(1, 3))})
+        fecha_limite = date(2025, 1, 1) + timedelta(days=rnd.randint(0, 365))
+        proyecto = plataforma.registrar_proyecto(f"proyecto-{i}", "-", fecha_limite, categorias)
+        for _ in range(rnd.randint(5, 35)):
+            plataforma.registrar_oferta(proyecto, generarOferta(rnd, rnd.choice(freelancers), fecha_limite))
+        proyectos.append(proyecto)
+    return {"plataforma": plataforma, "freelancers": freelancers, "proyectos": proyectos}
+
+def generarOferta(rnd: random.Random, freelancer, fecha_limite: date):
+    fecha_oferta = fecha_limite - timedelta(days=rnd.randint(0, 30))
+    if rnd.random() < 0.7:
+        return freelance.OfertaPorHora(freelancer, fecha_oferta, rnd.randint(10, 400), fecha_limite + timedelta(days=rnd.randint(7, 120)))
+    return freelance.OfertaPorPosicion(freelancer, fecha_oferta, rnd.randint(1000, 6000), 160, rnd.randint(1, 12))
+
+def generarKanban(n: int, semilla: int = 0) -> dict:
+    # n tareas en n / 200 tableros con cuatro listas, n / 20 personas; las
+    # tareas se crean escalonadas a lo largo de 180 dias, casi todas se
+    # asignan, parte avanza por el flujo y un 40 % se cierra.
+    rnd = random.Random(semilla)
+    sistema = kanban.Sistema()
+    personas = [kanban.Persona(f"persona-{i}", f"persona{i}@example.com") for i in range(max(2, n // 20))]
+    tableros = []
+    for i in range(max(1, n // 200)):
+        tablero = sistema.crear_tablero(f"tablero-{i}", rnd.choice(personas))
+        for titulo in ("En curso", "Revision", "Hecho"):
+            tablero.agregar_lista(kanban.Lista(titulo))
+        tableros.append(tablero)
+    hoy = date.today()
+    tareas = []
+    for i in range(n):
+        tablero = rnd.choice(tableros)
+        tipo = "DIU" if rnd.random() < 0.3 else "Programacion"
+        tarea = sistema.crear_tarea(tablero, f"tarea-{i}", "-", rnd.randint(1, 8), hoy + timedelta(days=rnd.randint(-30, 60)), tipo)
+        tarea.fecha_creacion = hoy - timedelta(days=180 * (n - i) // n)
+        if rnd.random() < 0.9:
+            sistema.asignar_tarea(tarea, elegirZipf(rnd, personas, 0.7))
+        destino = rnd.choice(("Backlog", "En curso", "Revision", "Hecho"))
+        if destino != "Backlog":
+            sistema.mover_tarea(tarea, tablero, destino)
+        if (destino == "Hecho" and rnd.random() < 0.8) or rnd.random() < 0.1:
+            sistema.cerrar_tarea(tarea)
+        tareas.append(tarea)
+    return {"sistema": sistema, "personas": personas, "tableros": tableros, "tareas": tareas}
+
+GENERADORES = {
+    "alquileres": generarAlquileres,
+    "cursos": generarCursos,
+    "archivos": generarArchivos,
+    "bicicletas": generarBicicletas,
+    "recursos": generarRecursos,
+    "trenes": generarTrenes,
+    "freelance": generarFreelance,
+    "kanban": generarKanban,
+}
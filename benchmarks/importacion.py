@@ -0,0 +1,63 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+sys.path.insert(0, str(SRC))
+from mdss import DOMINIOS
+from medicion import percentil
+
+# Mide el arranque en frio: cada muestra es un interprete nuevo que importa el
+# objetivo y devuelve, en microsegundos, lo que tardo solo la importacion.
+PLANTILLA = "import time; t = time.perf_counter(); import {objetivo}; print((time.perf_counter() - t) * 1e6)"
+
+def muestrear(objetivo: str, repeticiones: int) -> list:
+    entorno = dict(os.environ, PYTHONPATH=str(SRC), PYTHONDONTWRITEBYTECODE="")
+    muestras = []
+    for _ in range(repeticiones):
+        salida = subprocess.run(
+            [sys.executable, "-c", PLANTILLA.format(objetivo=objetivo)],
+            env=entorno, capture_output=True, text=True, check=True,
+        )
+        if salida.stdout.count("\n") != 1:
+            raise RuntimeError(f"La importacion de {objetivo} escribio en stdout: {salida.stdout!r}")
+        muestras.append(float(salida.stdout))
+    return muestras
+
+def resumen(muestras: list) -> dict:
+    return {
+        "repeticiones": len(muestras),
+        "media_ms": statistics.fmean(muestras) / 1000,
+        "p50_ms": percentil(muestras, 50) / 1000,
+        "p90_ms": percentil(muestras, 90) / 1000,
+        "max_ms": max(muestras) / 1000,
+    }
+
+def main(argumentos: list = None) -> int:
+    parser = argparse.ArgumentParser(description="Tiempo de importacion en frio del paquete mdss")
+    parser.add_argument("--repeticiones", type=int, default=20)
+    parser.add_argument("--limite-ms", type=float, default=5.0, help="limite para 'import mdss'")
+    parser.add_argument("--salida", type=Path, help="fichero JSON de resultados")
+    opciones = parser.parse_args(argumentos)
+
+    objetivos = ["mdss"] + [f"mdss.{dominio}" for dominio in DOMINIOS]
+    resultados = {objetivo: resumen(muestrear(objetivo, opciones.repeticiones)) for objetivo in objetivos}
+    for objetivo, datos in resultados.items():
+        print(f"{objetivo:<18} p50 {datos['p50_ms']:7.2f} ms  p90 {datos['p90_ms']:7.2f} ms")
+
+    documento = {"python": sys.version.split()[0], "resultados": resultados}
+    if opciones.salida is not None:
+        opciones.salida.write_text(json.dumps(documento, indent=2), encoding="utf-8")
+
+    if resultados["mdss"]["p50_ms"] > opciones.limite_ms:
+        print(f"import mdss supera el limite de {opciones.limite_ms} ms")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+import gc
+import time
+import tracemalloc
+
+def percentil(muestras: list, p: float) -> float:
+    ordenadas = sorted(muestras)
+    return ordenadas[min(len(ordenadas) - 1, int(len(ordenadas) * p / 100))]
+
+class Medidor:
+    # Mide operaciones sobre un conjunto de datos ya construido. Las
+    # latencias se toman llamada a llamada con perf_counter_ns y sin
+    # tracemalloc activo; la memoria pico de la operacion se mide aparte, en
+    # una llamada extra con tracemalloc, para no distorsionar los tiempos.
+
+    def __init__(self, repeticiones: int = 200, calentamiento: int = 5, memoria: bool = True):
+        self.repeticiones = repeticiones
+        self.calentamiento = calentamiento
+        self.memoria = memoria
+        self.operaciones = {}
+
+    def latencia(self, nombre: str, operacion, argumentos, repeticiones: int = None) -> dict:
+        # argumentos: funcion (indice -> tupla de argumentos) o lista de tuplas,
+        # generados antes de medir para que el azar no cuente en el tiempo.
+        repeticiones = min(repeticiones or self.repeticiones, self.repeticiones)
+        llamadas = self._argumentos(argumentos, self.calentamiento + repeticiones + 1)
+        for args in llamadas[:self.calentamiento]:
+            operacion(*args)
+        muestras = []
+        reloj = time.perf_counter_ns
+        gc.disable()
+        try:
+            for args in llamadas[self.calentamiento:-1]:
+                inicio = reloj()
+                operacion(*args)
+                muestras.append((reloj() - inicio) / 1000)
+        finally:
+            gc.enable()
+        resultado = {
+            "tipo": "latencia",
+            "repeticiones": len(muestras),
+            "media_us": sum(muestras) / len(muestras),
+            "p50_us": percentil(muestras, 50),
+            "p90_us": percentil(muestras, 90),
+            "p99_us": percentil(muestras, 99),
+            "max_us": max(muestras),
+        }
+        if self.memoria:
+            resultado["memoria_pico_bytes"] = self.picoMemoria(operacion, llamadas[-1])
+        self.operaciones[nombre] = resultado
+        return resultado
+
+    def rendimiento(self, nombre: str, operacion, unidades: int, **extra) -> dict:
+        # Una sola ejecucion de una carga completa (p. ej. N pagos o N compras
+        # en varios hilos); se informa de unidades por segundo. Si la operacion
+        # devuelve un dict, se anade al resultado (comprobaciones, contadores).
+        inicio = time.perf_counter()
+        detalles = operacion()
+        segundos = time.perf_counter() - inicio
+        resultado = {
+            "tipo": "rendimiento",
+            "unidades": unidades,
+            "segundos": segundos,
+            "por_segundo": unidades / segundos if segundos > 0 else float("inf"),
+            **extra,
+        }
+        if isinstance(detalles, dict):
+            resultado.update(detalles)
+        self.operaciones[nombre] = resultado
+        return resultado
+
+    @staticmethod
+    def picoMemoria(operacion, args) -> int:
+        tracemalloc.start()
+        try:
+            base = tracemalloc.get_traced_memory()[0]
+            operacion(*args)
+            return tracemalloc.get_traced_memory()[1] - base
+        finally:
+            tracemalloc.stop()
+
+    @staticmethod
+    def _argumentos(argumentos, cantidad: int) -> list:
+        if callable(argumentos):
+            return [argumentos(i) for i in range(cantidad)]
+        return [argumentos[i % len(argumentos)] for i in range(cantidad)]
+
+def construir(generador, *args, memoria: bool = True) -> tuple:
+    # Ejecuta un generador de datos y devuelve (datos, metricas): tiempo de
+    # construccion y, si se pide, memoria retenida y pico durante la carga.
+    # Con tracemalloc activo la construccion es mas lenta; el tiempo solo es
+    # comparable entre ejecuciones con la misma opcion.
+    gc.collect()
+    if memoria:
+        tracemalloc.start()
+    inicio = time.perf_counter()
+    try:
+        datos = generador(*args)
+        metricas = {"construccion_s": time.perf_counter() - inicio, "memoria_medida": memoria}
+        if memoria:
+            actual, pico = tracemalloc.get_traced_memory()
+            metricas["memoria_actual_bytes"] = actual
+            metricas["memoria_pico_bytes"] = pico
+    finally:
+        if memoria:
+            tracemalloc.stop()
+    return datos, metricas
@@ -0,0 +1,374 @@
+import argparse
+import asyncio
+import contextlib
+import datetime
+import json
+import os
+import platform
+import random
+import sys
+import threading
+from datetime import date, timedelta
+from functools import partial
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from mdss import DOMINIOS, alquileres, archivos, bicicletas, cursos, freelance, kanban, recursos, trenes
+from generadores import CATEGORIAS, GENERADORES, INICIO, generarOferta
+from medicion import Medidor, construir
+
+# Banco de pruebas de todos los dominios: para cada tamano genera un conjunto
+# de datos con semilla fija, mide la memoria de construirlo y la latencia
+# (p50/p90/p99) y memoria pico de sus operaciones calientes, mas algunas
+# cargas de rendimiento (pagos, compras concurrentes, emparejamiento, escalado
+# de la simulacion). Los resultados se escriben en JSON y pueden compararse
+# con una ejecucion anterior.
+#
+#   python benchmarks/suite.py --tamanos 1000,10000 --salida base.json
+#   python benchmarks/suite.py --tamanos 1000,10000 --comparar base.json
+
+HILOS = 8
+
+def medirAlquileres(datos: dict, medidor: Medidor, rnd: random.Random, n: int):
+    sistema, usuarios, propiedades = datos["sistema"], datos["usuarios"], datos["propiedades"]
+    dias = (datos["fin"] - INICIO).days
+
+    def rango(_):
+        inicio = INICIO + timedelta(days=rnd.randint(0, dias))
+        return rnd.choice(propiedades), inicio, inicio + timedelta(days=rnd.randint(1, 14))
+
+    medidor.latencia("propiedadDisponible", alquileres.Propiedad.propiedadDisponible, rango)
+
+    # Reservas nuevas a continuacion del calendario de cada propiedad, de modo
+    # que siempre estan libres y recorren todas las reservas existentes.
+    siguiente_libre = {propiedad: datos["fin"] + timedelta(days=30) for propiedad in propiedades}
+
+    def reserva(_):
+        propiedad = rnd.choice(propiedades)
+        inicio = siguiente_libre[propiedad]
+        siguiente_libre[propiedad] = inicio + timedelta(days=rnd.randint(1, 14))
+        return rnd.choice(usuarios), propiedad, inicio, siguiente_libre[propiedad]
+
+    medidor.latencia("hacerReserva", sistema.hacerReserva, reserva)
+    reservas = [reserva for usuario in usuarios for reserva in usuario.reservas]
+    medidor.latencia("calcularPrecioFinal", alquileres.Reserva.calcularPrecioFinal, lambda _: (rnd.choice(reservas),))
+
+def medirCursos(datos: dict, medidor: Medidor, rnd: random.Random, n: int):
+    sistema, usuarios, lista_cursos = datos["sistema"], datos["usuarios"], datos["cursos"]
+    presenciales = [curso for curso in lista_cursos if isinstance(curso, cursos.CursoPresencial)]
+    medidor.latencia("matricular", cursos.Usuario.matricular, lambda _: (rnd.choice(usuarios), rnd.choice(lista_cursos), date.today()))
+    medidor.latencia("hayPlazasLibres", cursos.CursoPresencial.hayPlazasLibres, lambda _: (rnd.choice(presenciales),))
+    medidor.latencia("comenzarCurso", sistema.comenzarCurso, lambda _: (rnd.choice(presenciales),), repeticiones=50)
+    medidor.latencia("getPromedio", sistema.getPromedio, [()], repeticiones=20)
+    medidor.latencia("getMejorValoracion", sistema.getMejorValoracion, [()], repeticiones=20)
+
+def medirArchivos(datos: dict, medidor: Medidor, rnd: random.Random, n: int):
+    propietario, invitados = datos["propietario"], datos["invitados"]
+    directorios, lista_archivos = datos["directorios"], datos["archivos"]
+    medidor.latencia("calcularPeso", archivos.Directorio.calcularPeso, [(propietario.raiz,)], repeticiones=20)
+    medidor.latencia("contarArchivos", archivos.Directorio.contarArchivos, [(propietario.raiz,)], repeticiones=20)
+    medidor.latencia("calcularPesoSubdirectorio", archivos.Directorio.calcularPeso, lambda _: (rnd.choice(directorios),))
+    medidor.latencia("puedeAcceder", archivos.puedeAcceder, lambda _: (rnd.choice(invitados), rnd.choice(lista_archivos)))
+    medidor.latencia("crearArchivo", propietario.crearArchivo, lambda i: (f"nuevo-{i}.dat", rnd.randint(1, 1000), rnd.choice(directorios)))
+
+def viaje(sistema: bicicletas.Sistema, usuario, origen, destinos: list, instante: datetime.datetime) -> bool:
+    uso = sistema.retirarBicicleta(usuario, origen, instante)
+    if uso is None:
+        return False
+    # Si los destinos elegidos estan llenos se prueba el origen y despues
+    # cualquier estacion: la bicicleta nunca queda fuera del sistema.
+    for destino in [*destinos, origen, *sistema.estaciones]:
+        if sistema.devolverBicicleta(uso, destino, instante + timedelta(minutes=20)):
+            return True
+    return False
+
+def medirBicicletas(datos: dict, medidor: Medidor, rnd: random.Random, n: int):
+    sistema, estaciones, usuarios = datos["sistema"], datos["estaciones"], datos["usuarios"]
+    inicio = datetime.datetime(2024, 4, 1)
+
+    def argumentosViaje(i):
+        destinos = [rnd.choice(estaciones) for _ in range(3)]
+        return sistema, rnd.choice(usuarios), rnd.choice(estaciones), destinos, inicio + timedelta(minutes=i)
+
+    medidor.latencia("retirarYDevolver", viaje, argumentosViaje)
+    medidor.latencia("prevision", sistema.analitica.prevision, lambda _: (rnd.randint(0, 23),))
+    medidor.latencia("planRebalanceo", sistema.planRebalanceo, lambda _: (rnd.randint(0, 23),), repeticiones=50)
+
+    # Cola de pagos asincrona contra una pasarela simulada de 1 ms.
+    total = min(n, 10000)
+    cola = bicicletas.ColaPagos(bicicletas.ProcesadorPagosLocal(latencia=0.001), tamano_lote=500, max_concurrencia=100)
+    for i in range(total):
+        cola.encolarPago(bicicletas.Pago(f"tarjeta-{i}", rnd.randint(1, 20)))
+
+    def vaciarCola():
+        asyncio.run(cola.vaciar())
+        return {"procesados": cola.procesados, "fallidos": len(cola.fallidos)}
+
+    medidor.rendimiento("colaPagos", vaciarCola, total)
+
+    # Estres de estaciones: varios hilos retiran, devuelven y rebalancean a la
+    # vez; al final no debe haberse perdido ni duplicado ninguna bicicleta.
+    operaciones = min(n, 20000)
+    bicicletas_antes = sum(len(estacion.bicicletas) for estacion in estaciones)
+
+    semillas = [rnd.random() for _ in range(HILOS)]
+
+    def trabajador(indice: int):
+        azar = random.Random(semillas[indice])
+        for i in range(operaciones // HILOS):
+            if i % 50 == 0:
+                origen, destino = azar.sample(estaciones, 2)
+                sistema.rebalancear(origen, destino, 1)
+                continue
+            destinos = [azar.choice(estaciones) for _ in range(3)]
+            viaje(sistema, azar.choice(usuarios), azar.choice(estaciones), destinos, inicio + timedelta(minutes=i))
+
+    def estres():
+        hilos = [threading.Thread(target=trabajador, args=(i,)) for i in range(HILOS)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+        despues = sum(len(estacion.bicicletas) for estacion in estaciones)
+        return {"hilos": HILOS, "consistente": despues == bicicletas_antes}
+
+    medidor.rendimiento("estresEstaciones", estres, operaciones // HILOS * HILOS)
+
+def medirRecursos(datos: dict, medidor: Medidor, rnd: random.Random, n: int):
+    indice, creadores, usuarios = datos["indice"], datos["creadores"], datos["usuarios"]
+    lista_recursos, registro = datos["recursos"], datos["registro"]
+    hoy = date.today()
+    medidor.latencia("precioYPuntos", recursos.Recurso.precioYPuntos, lambda _: (rnd.choice(lista_recursos),))
+    medidor.latencia("registrarCompra", registro.registrarCompra, lambda _: (rnd.choice(usuarios), rnd.choice(lista_recursos)))
+    medidor.latencia("consolidar", registro.consolidar, [()], repeticiones=50)
+    medidor.latencia("topCreadores", indice.topCreadores, [(10,)])
+    medidor.latencia("topCreadoresMes", indice.topCreadores, [(10, hoy.year, hoy.month)])
+    medidor.latencia("posicionCreador", indice.posicionCreador, lambda _: (rnd.choice(creadores),))
+    medidor.latencia("preciosCatalogo", recursos.preciosCatalogo, [(lista_recursos,)], repeticiones=10)
+
+    def cargarAlmacen():
+        almacen = recursos.AlmacenRecursos(datos["estrategias"], creadores)
+        almacen.cargarFilas(datos["filas"])
+        return almacen
+
+    medidor.latencia("cargarAlmacen", cargarAlmacen, [()], repeticiones=5)
+    medidor.latencia("preciosAlmacen", recursos.AlmacenRecursos.preciosYPuntos, [(cargarAlmacen(),)], repeticiones=20)
+
+    # Compras por segundo con varios hilos sobre un registro nuevo, con la
+    # consolidacion periodica y la liberacion crowd-based activas.
+    total = min(2 * n, 100000)
+    motor = recursos.MotorLiberacion()
+    registro_concurrente = recursos.RegistroCompras(motor_liberacion=motor)
+    compras = [(rnd.choice(usuarios), rnd.choice(lista_recursos)) for _ in range(total // HILOS * HILOS)]
+
+    def comprar(indice: int):
+        tramo = len(compras) // HILOS
+        for usuario, recurso in compras[indice * tramo:(indice + 1) * tramo]:
+            registro_concurrente.registrarCompra(usuario, recurso)
+
+    def comprasConcurrentes():
+        registro_concurrente.iniciarConsolidacionPeriodica(0.05)
+        hilos = [threading.Thread(target=comprar, args=(i,)) for i in range(HILOS)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+        registro_concurrente.detenerConsolidacionPeriodica()
+        motor.esperarEntregas()
+        return {
+            "hilos": HILOS,
+            "compras_registradas": registro_concurrente.numeroCompras(),
+            "fragmentos_usados": registro_concurrente.fragmentosUsados(),
+            "consistente": registro_concurrente.fragmentosUsados() > 1,
+        }
+
+    medidor.rendimiento("comprasPorSegundo", comprasConcurrentes, len(compras))
+    motor.cerrar()
+    datos["motor"].cerrar()
+
+def cambiarPrecioYRecalcular(sistema: trenes.SistemaMantenimiento, repuesto: trenes.Repuesto, precio: float):
+    repuesto.cambiarPrecio(precio)
+    return sistema.obtenerPlanesMantenimientoMasCostosos()
+
+def simularCostes(simulador: trenes.SimuladorCostes, escenarios: list):
+    simulador.simular(escenarios, 365)
+
+def medirTrenes(datos: dict, medidor: Medidor, rnd: random.Random, n: int):
+    sistema, flota = datos["sistema"], datos["trenes"]
+    medidor.latencia("costeMes", sistema.obtenerCostoTareasPorMes, lambda _: (rnd.choice(flota), 2024, rnd.randint(1, 12)))
+
+    def rango(_):
+        desde = INICIO + timedelta(days=rnd.randint(0, 300))
+        return rnd.choice(flota), desde, desde + timedelta(days=rnd.randint(1, 65))
+
+    medidor.latencia("costeEntre", sistema.obtenerCostoTareasEntre, rango)
+    medidor.latencia("costesFlotaPorMes", sistema.obtenerCostesFlotaPorMes, [()], repeticiones=10)
+    medidor.latencia("planesMasCostosos", cambiarPrecioYRecalcular, lambda _: (sistema, rnd.choice(datos["repuestos"]), rnd.randint(10, 500)))
+    medidor.latencia("proximos", sistema.planificador.proximos, lambda _: (INICIO + timedelta(days=rnd.randint(0, 60)),), repeticiones=50)
+    medidor.latencia("kmPorSemana", lambda tren: tren.telemetria.kmPorSemana(INICIO, date(2025, 1, 1)), lambda _: (rnd.choice(flota),))
+    instante = trenes.segundosDesdeEpoca(datetime.datetime(2025, 1, 1))
+    medidor.latencia("registrarViajes", trenes.Tren.registrarViajes, lambda i: (rnd.choice(flota), [instante + i * 60], [rnd.uniform(20, 600)]))
+
+    # Escalado de la simulacion de costes con el numero de procesos.
+    escenarios = [trenes.EscenarioUso(f"escenario-{i}", 0.5 + i * 0.25) for i in range(8)]
+    filas = len(trenes.SimuladorCostes(sistema).prepararFilas(date.today()))
+    for procesos in (1, 2, 4):
+        simulador = trenes.SimuladorCostes(sistema, max_procesos=procesos, umbral_filas=0)
+        medidor.rendimiento(f"simular{procesos}Procesos", partial(simularCostes, simulador, escenarios), filas * len(escenarios), procesos=procesos)
+        simulador.cerrar()
+
+def medirFreelance(datos: dict, medidor: Medidor, rnd: random.Random, n: int):
+    plataforma, freelancers, proyectos = datos["plataforma"], datos["freelancers"], datos["proyectos"]
+    medidor.latencia("recomendar_ofertas", freelance.Proyecto.recomendar_ofertas, lambda _: (rnd.choice(proyectos),))
+    medidor.latencia("mejores_ofertas", freelance.Proyecto.mejores_ofertas, lambda _: (rnd.choice(proyectos), 10))
+
+    def oferta(_):
+        proyecto = rnd.choice(proyectos)
+        return proyecto, generarOferta(rnd, rnd.choice(freelancers), proyecto.fecha_limite_ofertas)
+
+    medidor.latencia("agregar_oferta", plataforma.registrar_oferta, oferta)
+    medidor.latencia("buscar_freelancers", plataforma.buscar_freelancers, lambda _: (rnd.sample(CATEGORIAS[:10], 2),))
+    medidor.latencia("buscar_proyectos", plataforma.buscar_proyectos, lambda _: (rnd.sample(CATEGORIAS[:10], 2), False))
+
+    motor = freelance.MotorEmparejamiento(plataforma)
+    motor.preparar()
+    medidor.latencia("candidatos", motor.candidatos, lambda _: (rnd.choice(proyectos), 10))
+    abiertos = len(plataforma.proyectos_abiertos())
+
+    def emparejar():
+        plataforma.emparejar_freelancers(10)
+
+    medidor.rendimiento("emparejar", emparejar, abiertos, freelancers=len(freelancers))
+    # Avanza el calendario dia a dia cerrando los plazos vencidos.
+    medidor.latencia("cerrar_ofertas_vencidas", plataforma.cerrar_ofertas_vencidas, lambda i: (date(2025, 1, 1) + timedelta(days=i),))
+
+def medirKanban(datos: dict, medidor: Medidor, rnd: random.Random, n: int):
+    sistema, personas, tableros, tareas = datos["sistema"], datos["personas"], datos["tableros"], datos["tareas"]
+    listas = ("Backlog", "En curso", "Revision", "Hecho")
+
+    def movimiento(_):
+        tarea = rnd.choice(tareas)
+        antes_de = rnd.choice(tareas) if rnd.random() < 0.5 else None
+        return tarea, tarea.tablero, rnd.choice(listas), antes_de
+
+    medidor.latencia("mover_tarea", sistema.mover_tarea, movimiento)
+    # Paginas por cursor: se parte de una tarea abierta cualquiera.
+    abiertas = list(sistema.tareas_abiertas)
+    medidor.latencia("listar_tareas_pendientes", sistema.listar_tareas_pendientes, lambda _: (rnd.choice(abiertas), 50))
+    medidor.latencia("listar_tareas_usuario", sistema.listar_tareas_usuario, lambda _: (rnd.choice(personas), None, 50))
+    medidor.latencia("puntajes_sprint", kanban.Tablero.puntajes_sprint, lambda _: (rnd.choice(tableros),))
+    medidor.latencia("resumen_metricas", kanban.MetricasCiclo.resumen, [(sistema.metricas.ciclo_por_persona,)], repeticiones=20)
+
+    def creacion(i):
+        return rnd.choice(tableros), f"nueva-{i}", "-", rnd.randint(1, 8), date.today(), rnd.choice(("DIU", "Programacion"))
+
+    medidor.latencia("crear_tarea", sistema.crear_tarea, creacion)
+    pendientes = list(sistema.tareas_abiertas)
+    rnd.shuffle(pendientes)
+    medidor.latencia("cerrar_tarea", sistema.cerrar_tarea, [(tarea,) for tarea in pendientes], repeticiones=max(1, len(pendientes) - medidor.calentamiento - 1))
+
+BENCHMARKS = {
+    "alquileres": medirAlquileres,
+    "cursos": medirCursos,
+    "archivos": medirArchivos,
+    "bicicletas": medirBicicletas,
+    "recursos": medirRecursos,
+    "trenes": medirTrenes,
+    "freelance": medirFreelance,
+    "kanban": medirKanban,
+}
+
+def ejecutar(dominios: list, tamanos: list, repeticiones: int, semilla: int, memoria: bool, consola) -> dict:
+    resultados = {}
+    with open(os.devnull, "w", encoding="utf-8") as nulo, contextlib.redirect_stdout(nulo):
+        for dominio in dominios:
+            for n in tamanos:
+                datos, metricas = construir(GENERADORES[dominio], n, semilla, memoria=memoria)
+                medidor = Medidor(repeticiones, memoria=memoria)
+                BENCHMARKS[dominio](datos, medidor, random.Random(semilla + 1), n)
+                resultados.setdefault(dominio, {})[str(n)] = {"datos": metricas, "operaciones": medidor.operaciones}
+                mostrar(consola, dominio, n, metricas, medidor.operaciones)
+                del datos
+    return resultados
+
+def mostrar(consola, dominio: str, n: int, metricas: dict, operaciones: dict):
+    memoria = f", {metricas['memoria_actual_bytes'] / 2 ** 20:.1f} MiB" if metricas["memoria_medida"] else ""
+    print(f"{dominio} n={n}: datos en {metricas['construccion_s']:.2f} s{memoria}", file=consola)
+    for nombre, resultado in operaciones.items():
+        if resultado["tipo"] == "latencia":
+            print(f"  {nombre:<28} p50 {resultado['p50_us']:>10.1f} us  p90 {resultado['p90_us']:>10.1f} us  p99 {resultado['p99_us']:>10.1f} us", file=consola)
+        else:
+            print(f"  {nombre:<28} {resultado['por_segundo']:>12.0f} /s  ({resultado['unidades']} en {resultado['segundos']:.2f} s)", file=consola)
+    consola.flush()
+
+def medirImportacion(repeticiones: int) -> dict:
+    from importacion import muestrear, resumen
+    objetivos = ["mdss"] + [f"mdss.{dominio}" for dominio in DOMINIOS]
+    return {objetivo: resumen(muestrear(objetivo, repeticiones)) for objetivo in objetivos}
+
+def comparar(actual: dict, base: dict, umbral: float) -> list:
+    # Regresiones entre dos ejecuciones: p50 de latencia que crece, o
+    # rendimiento que cae, por encima del umbral (1.25 = un 25 % peor).
+    regresiones = []
+    for dominio, por_tamano in actual["resultados"].items():
+        for tamano, resultado in por_tamano.items():
+            anteriores = base.get("resultados", {}).get(dominio, {}).get(tamano, {}).get("operaciones", {})
+            for nombre, medida in resultado["operaciones"].items():
+                anterior = anteriores.get(nombre)
+                if anterior is None or anterior["tipo"] != medida["tipo"]:
+                    continue
+                if medida["tipo"] == "latencia":
+                    factor = medida["p50_us"] / anterior["p50_us"] if anterior["p50_us"] else 1.0
+                else:
+                    factor = anterior["por_segundo"] / medida["por_segundo"] if medida["por_segundo"] else float("inf")
+                if factor > umbral:
+                    regresiones.append((dominio, tamano, nombre, factor))
+    return regresiones
+
+def main(argumentos: list = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks de los dominios de mdss con datos sinteticos")
+    parser.add_argument("--dominios", default=",".join(BENCHMARKS), help="lista separada por comas")
+    parser.add_argument("--tamanos", default="1000,10000", help="escalas separadas por comas")
+    parser.add_argument("--repeticiones", type=int, default=200)
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--sin-memoria", action="store_true", help="no medir memoria con tracemalloc")
+    parser.add_argument("--importacion", action="store_true", help="medir tambien el tiempo de importacion")
+    parser.add_argument("--salida", type=Path, help="fichero JSON de resultados")
+    parser.add_argument("--comparar", type=Path, help="JSON de una ejecucion anterior")
+    parser.add_argument("--umbral", type=float, default=1.25)
+    opciones = parser.parse_args(argumentos)
+
+    dominios = [dominio for dominio in opciones.dominios.split(",") if dominio]
+    desconocidos = [dominio for dominio in dominios if dominio not in BENCHMARKS]
+    if desconocidos:
+        parser.error(f"dominios desconocidos: {', '.join(desconocidos)}")
+    tamanos = [int(tamano) for tamano in opciones.tamanos.split(",") if tamano]
+
+    documento = {
+        "meta": {
+            "fecha": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "plataforma": platform.platform(),
+            "semilla": opciones.semilla,
+            "repeticiones": opciones.repeticiones,
+            "memoria": not opciones.sin_memoria,
+        },
+        "resultados": ejecutar(dominios, tamanos, opciones.repeticiones, opciones.semilla, not opciones.sin_memoria, sys.stdout),
+    }
+    if opciones.importacion:
+        documento["importacion"] = medirImportacion(min(opciones.repeticiones, 20))
+    if opciones.salida is not None:
+        opciones.salida.write_text(json.dumps(documento, indent=2), encoding="utf-8")
+
+    if opciones.comparar is not None:
+        base = json.loads(opciones.comparar.read_text(encoding="utf-8"))
+        regresiones = comparar(documento, base, opciones.umbral)
+        for dominio, tamano, nombre, factor in regresiones:
+            print(f"Regresion: {dominio} n={tamano} {nombre} x{factor:.2f}")
+        if regresiones:
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,27 @@
+from importlib import import_module
+
+# Los dominios se cargan bajo demanda: "import mdss" no importa ningun modelo
+# ni ejecuta sus demos; mdss.kanban (o "from mdss import kanban") importa solo
+# ese submodulo la primera vez que se accede.
+DOMINIOS = (
+    "alquileres",
+    "cursos",
+    "archivos",
+    "bicicletas",
+    "recursos",
+    "trenes",
+    "freelance",
+    "kanban",
+)
+
+__all__ = list(DOMINIOS)
+
+def __getattr__(nombre: str):
+    if nombre in DOMINIOS:
+        modulo = import_module(f"{__name__}.{nombre}")
+        globals()[nombre] = modulo
+        return modulo
+    raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(DOMINIOS))
@@ -0,0 +1,21 @@
+import runpy
+import sys
+
+from mdss import DOMINIOS
+
+# python -m mdss <dominio> ejecuta la demo del dominio; sin argumentos lista
+# los dominios disponibles.
+def main(argumentos: list) -> int:
+    if not argumentos:
+        print("Uso: python -m mdss <dominio>")
+        print("Dominios: " + ", ".join(DOMINIOS))
+        return 0
+    dominio = argumentos[0]
+    if dominio not in DOMINIOS:
+        print(f"Dominio desconocido: {dominio}. Dominios: " + ", ".join(DOMINIOS))
+        return 2
+    runpy.run_module(f"mdss.{dominio}", run_name="__main__", alter_sys=True)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
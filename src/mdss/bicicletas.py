@@ -0,0 +1,553 @@
+﻿from __future__ import annotations
+from math import e
+from typing import List, Dict
+from datetime import date, datetime, timedelta
+from abc import ABC, abstractmethod
+from collections import deque, defaultdict
+from itertools import count
+from math import ceil, floor
+import asyncio
+import heapq
+import random
+import threading
+import time
+
+class Estacion:
+
+    def __init__(self, ubicacion, capacidad):
+        self.ubicacion: str = ubicacion
+        self.capacidad: int = capacidad
+        self.bicicletas: List[Bicicleta] = []
+        # Cada reserva pertenece a un titular (el usuario que la hizo): solo
+        # sus devoluciones pueden ocupar ese lugar.
+        self.reservas: int = 0
+        self.reservas_por_titular: Dict[Usuario, int] = {}
+        self.lock: threading.RLock = threading.RLock()
+
+    def registrarBicicleta(self, id_bicicleta) -> Bicicleta | None:
+        with self.lock:
+            if not self.estacionamientoDisponible():
+                print(f"Error: No hay estacionamiento disponible en [{self.ubicacion}]")
+                return None
+            bicicleta = Bicicleta(id_bicicleta)
+            self.bicicletas.append(bicicleta)
+            return bicicleta
+     
+    def sacarBicicleta(self, bicicleta) -> bool:
+        with self.lock:
+            if not self.estaBicicleta(bicicleta):
+                print(f"Error: Bicicleta no se encuentra la estacion {self.ubicacion}")
+                return False
+            self.bicicletas.remove(bicicleta)
+            return True
+               
+    def estacionarBicicleta(self, bicicleta, titular = None) -> bool:
+        with self.lock:
+            if not self.liberarReserva(titular) and not self.estacionamientoDisponible():
+                print(f"Error: No hay estacionamiento disponible en {self.ubicacion}")
+                return False
+            self.bicicletas.append(bicicleta)
+            return True 
+
+    def reservarEstacionamiento(self, titular) -> bool:
+        with self.lock:
+            if not self.estacionamientoDisponible():
+                return False
+            self.reservas += 1
+            self.reservas_por_titular[titular] = self.reservas_por_titular.get(titular, 0) + 1
+            return True
+
+    def cancelarReserva(self, titular) -> bool:
+        with self.lock:
+            return self.liberarReserva(titular)
+
+    def liberarReserva(self, titular) -> bool:
+        pendientes = self.reservas_por_titular.get(titular, 0)
+        if pendientes == 0:
+            return False
+        if pendientes == 1:
+            del self.reservas_por_titular[titular]
+        else:
+            self.reservas_por_titular[titular] = pendientes - 1
+        self.reservas -= 1
+        return True
+
+    def bicicletaDisponible(self) -> bool:
+        return bool(self.bicicletas)
+
+    def estacionamientoDisponible(self) -> bool:
+        return len(self.bicicletas) + self.reservas < self.capacidad
+
+    def estacionamientosLibres(self) -> int:
+        return self.capacidad - len(self.bicicletas) - self.reservas
+    
+    def estaBicicleta(self, bicicleta) -> bool:
+        return bicicleta in self.bicicletas
+
+class Bicicleta:
+
+    def __init__(self, id):
+        self.id: str = id
+
+class Usuario:
+    
+    def __init__(self, dni, nombre, apellido, num_tarjeta, abono = None):
+        self.dni : str = dni
+        self.nombre: str = nombre
+        self.apellido: str = apellido
+        self.num_tarjeta: str = num_tarjeta
+        self.abono: Abono = abono
+
+    def cambiarAbono(self, abono):
+        self.abono = abono
+
+class Uso:
+
+    def __init__(self, usuario, bicicleta, estacion, fecha_hora):
+        self.usuario: Usuario = usuario
+        self.bicicleta: Bicicleta = bicicleta
+        self.estacion_retirada: Estacion = estacion
+        self.fecha_hora_retirada: datetime = fecha_hora
+        self.estacion_devolucion: Estacion = None
+        self.fecha_hora_devolucion: datetime = None
+        self.pago: Pago = None
+        self.lock: threading.Lock = threading.Lock()
+        
+    def finalizarUso(self, estacion, fecha_hora, cola_pagos = None):
+        print(f"Finalizando Uso de {self.usuario.nombre}")
+        self.estacion_devolucion = estacion
+        self.fecha_hora_devolucion = fecha_hora
+        importe = self.calcularCoste()
+        self.pago = Pago(self.usuario.num_tarjeta, importe)
+        if cola_pagos is not None:
+            cola_pagos.encolarPago(self.pago)
+            return
+        self.pago.procesarPago()
+
+    def bicicletaEnUso(self) -> bool:
+        return self.estacion_devolucion is None
+
+    def tiempoDeUso(self) -> timedelta:
+        if self.fecha_hora_devolucion:
+            return self.fecha_hora_devolucion - self.fecha_hora_retirada
+        return timedelta(0)
+
+    def calcularCoste(self) -> float:
+        tiempo_de_uso = self.tiempoDeUso()
+        precio = self.usuario.abono.calcularPrecio(tiempo_de_uso)
+        print(f"Tiempo de uso: {tiempo_de_uso}, Coste: {precio:.2f}")
+        return precio
+
+class Abono(ABC):
+
+    @abstractmethod
+    def abonoValido(self) -> bool:
+        pass
+
+    @abstractmethod
+    def calcularPrecio(self, tiempo_de_uso) -> float:
+        pass
+
+    def cobrarRetraso(self):
+        pass
+
+class AbonoAnual(Abono):
+    
+    def __init__(self, fecha_inicio):
+        super().__init__()
+        self.fecha_inicio: date = fecha_inicio
+
+    def abonoValido(self) -> bool:
+        return date.today() <= self.fecha_inicio + timedelta(days = 365)
+
+    def calcularPrecio(self, tiempo_de_uso) -> float:
+        if not self.abonoValido():
+            print("Error: El abono ha vencido. No se puede calcular el precio.")
+            return float('inf')
+        
+        tiempo_extra = max(tiempo_de_uso - timedelta(minutes = 30), timedelta(0))
+        precio = ((tiempo_extra.total_seconds() // (5 * 60)) + 1) * 2
+        return precio
+
+class AbonoPrePago(Abono):    
+
+    def __init__(self, saldo):
+        super().__init__()
+        self.saldo: float = saldo
+  
+    def abonoValido(self) -> bool:
+        return self.saldo >= 5
+
+    def calcularPrecio(self, tiempo_de_uso) -> float:
+        if not self.abonoValido():
+            print("Error: Saldo insuficiente")
+            return float('inf')  
+
+        precio = ((tiempo_de_uso.total_seconds() // (15 * 60)) + 1) * 5
+        self.reducirSaldo(precio)
+        return precio
+
+    def recargarSaldo(self, recarga):
+        self.saldo += recarga
+
+    def reducirSaldo(self, pago):
+        self.saldo -= pago
+         
+class AbonoTuristico(Abono):    
+
+    def __init__(self, fecha_inicio):
+        super().__init__()
+        self.fecha_inicio: date = fecha_inicio
+
+    def abonoValido(self) -> bool:
+        return date.today() <= self.fecha_inicio + timedelta(days = 7)
+
+    def calcularPrecio(self, tiempo_de_uso):
+        if not self.abonoValido():
+            print("Error: El abono ha vencido. No se puede calcular el precio.")
+            return float('inf')
+        
+        tiempo_extra = max(tiempo_de_uso - timedelta(hours = 2), timedelta(0))
+        precio = ((tiempo_extra.total_seconds() // (15 * 60)) + 1) * 10
+        return precio
+
+
+class Pago:
+    
+    def __init__(self, num_tarjeta, importe):
+        self.num_tarjeta: str = num_tarjeta
+        self.importe: float = importe
+        self.procesado: bool = False
+        self.intentos: int = 0
+
+    def procesarPago(self) -> bool:
+        #print(f"procesando pago en {self.num_tarjeta}. Importe: {self.importe}")
+        self.procesado = True
+        return True
+
+class ProcesadorPagos(ABC):
+
+    @abstractmethod
+    async def cobrar(self, pago) -> bool:
+        pass
+
+class ProcesadorPagosLocal(ProcesadorPagos):
+    # Procesador falso para pruebas y benchmarks: simula la latencia de red
+    # de la pasarela de pago y, opcionalmente, un porcentaje de rechazos.
+
+    def __init__(self, latencia = 0.05, tasa_fallos = 0.0):
+        self.latencia: float = latencia
+        self.tasa_fallos: float = tasa_fallos
+        self.cobros: int = 0
+
+    async def cobrar(self, pago) -> bool:
+        await asyncio.sleep(self.latencia)
+        if random.random() < self.tasa_fallos:
+            return False
+        self.cobros += 1
+        return pago.procesarPago()
+
+class ColaPagos:
+    # Los pagos se encolan al finalizar el uso y un trabajador asyncio los
+    # cobra por lotes, con un maximo de cobros simultaneos. Cada lote hace un
+    # solo intento por pago: los rechazados vuelven a la cola con una hora de
+    # vencimiento (espera exponencial) y no retrasan al resto de los cobros.
+    # detener() deja una marca en la cola: el trabajador termina de cobrar lo
+    # pendiente y sale, aunque se llame antes de que empiece.
+
+    FIN = object()
+
+    def __init__(self, procesador, tamano_lote = 50, max_concurrencia = 10, max_reintentos = 3, espera_reintento = 0.1):
+        self.procesador: ProcesadorPagos = procesador
+        self.tamano_lote: int = tamano_lote
+        self.max_concurrencia: int = max_concurrencia
+        self.max_reintentos: int = max_reintentos
+        self.espera_reintento: float = espera_reintento
+        self.pendientes: deque[Pago] = deque()
+        self.reintentos: List[tuple] = []
+        self.secuencia_reintentos = count()
+        self.fallidos: List[Pago] = []
+        self.procesados: int = 0
+        self._activa: bool = True
+        self._loop: asyncio.AbstractEventLoop = None
+        self._hay_pagos: asyncio.Event = None
+
+    def encolarPago(self, pago) -> None:
+        self.pendientes.append(pago)
+        self._despertar()
+
+    def siguienteLote(self) -> List[Pago]:
+        # Primero los reintentos ya vencidos y despues los pagos nuevos.
+        lote = []
+        ahora = time.monotonic()
+        while self.reintentos and self.reintentos[0][0] <= ahora and len(lote) < self.tamano_lote:
+            lote.append(heapq.heappop(self.reintentos)[2])
+        while self.pendientes and len(lote) < self.tamano_lote:
+            pago = self.pendientes.popleft()
+            if pago is not self.FIN:
+                lote.append(pago)
+        return lote
+
+    def reprogramarPago(self, pago) -> None:
+        vence = time.monotonic() + self.espera_reintento * 2 ** (pago.intentos - 1)
+        heapq.heappush(self.reintentos, (vence, next(self.secuencia_reintentos), pago))
+
+    def esperaProximoReintento(self) -> float | None:
+        if not self.reintentos:
+            return None
+        return max(self.reintentos[0][0] - time.monotonic(), 0.0)
+
+    def hayPagos(self) -> bool:
+        return bool(self.pendientes or self.reintentos)
+
+    async def procesarLote(self, lote) -> None:
+        semaforo = asyncio.Semaphore(self.max_concurrencia)
+        resultados = await asyncio.gather(*(self._cobrar(pago, semaforo) for pago in lote))
+        for pago, cobrado in zip(lote, resultados):
+            if cobrado:
+                self.procesados += 1
+            elif pago.intentos < self.max_reintentos:
+                self.reprogramarPago(pago)
+            else:
+                self.fallidos.append(pago)
+
+    async def vaciar(self) -> None:
+        while self.hayPagos():
+            lote = self.siguienteLote()
+            if lote:
+                await self.procesarLote(lote)
+            else:
+                await asyncio.sleep(self.esperaProximoReintento())
+
+    async def trabajador(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._hay_pagos = asyncio.Event()
+        while self._activa or self.hayPagos():
+            lote = self.siguienteLote()
+            if lote:
+                await self.procesarLote(lote)
+                continue
+            if not self._activa and not self.hayPagos():
+                break
+            self._hay_pagos.clear()
+            if self.pendientes:
+                continue
+            try:
+                await asyncio.wait_for(self._hay_pagos.wait(), self.esperaProximoReintento())
+            except asyncio.TimeoutError:
+                pass
+
+    def detener(self) -> None:
+        self._activa = False
+        self.pendientes.append(self.FIN)
+        self._despertar()
+
+    async def _cobrar(self, pago, semaforo) -> bool:
+        async with semaforo:
+            pago.intentos += 1
+            try:
+                return await self.procesador.cobrar(pago)
+            except Exception as error:
+                print(f"Error: Fallo al cobrar en {pago.num_tarjeta}: {error}")
+                return False
+
+    def _despertar(self) -> None:
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._hay_pagos.set)
+
+
+class AnaliticaDemanda:
+    # Acumula de forma incremental los flujos origen-destino por hora del dia.
+    # Las matrices se guardan dispersas (solo los pares con viajes), de modo que
+    # la memoria crece con los flujos observados y no con estaciones^2.
+
+    def __init__(self):
+        self.flujos: List[Dict[tuple, int]] = [defaultdict(int) for _ in range(24)]
+        self.salidas: List[Dict[Estacion, int]] = [defaultdict(int) for _ in range(24)]
+        self.llegadas: List[Dict[Estacion, int]] = [defaultdict(int) for _ in range(24)]
+        self.dias_observados: set = set()
+
+    def registrarUso(self, uso) -> None:
+        hora_retirada = uso.fecha_hora_retirada.hour
+        hora_devolucion = uso.fecha_hora_devolucion.hour
+        self.flujos[hora_retirada][(uso.estacion_retirada, uso.estacion_devolucion)] += 1
+        self.salidas[hora_retirada][uso.estacion_retirada] += 1
+        self.llegadas[hora_devolucion][uso.estacion_devolucion] += 1
+        self.dias_observados.add(uso.fecha_hora_retirada.date())
+
+    def matrizOrigenDestino(self, hora) -> Dict[tuple, int]:
+        return dict(self.flujos[hora])
+
+    def prevision(self, hora) -> Dict[Estacion, float]:
+        # Variacion neta media de bicicletas por estacion durante esa hora.
+        dias = max(len(self.dias_observados), 1)
+        variacion = defaultdict(float)
+        for estacion, cantidad in self.llegadas[hora].items():
+            variacion[estacion] += cantidad / dias
+        for estacion, cantidad in self.salidas[hora].items():
+            variacion[estacion] -= cantidad / dias
+        return variacion
+
+    def planRebalanceo(self, estaciones, hora = None, ocupacion_min = 0.2, ocupacion_max = 0.8) -> List[tuple]:
+        # Devuelve movimientos (origen, destino, cantidad) que llevan cada
+        # estacion a su rango objetivo moviendo el minimo de bicicletas posible;
+        # se emparejan siempre el mayor excedente con el mayor deficit. Lo que
+        # sobra despues se reparte con las estaciones que ya estan en rango: el
+        # excedente va a su hueco hasta el maximo y el deficit se cubre con sus
+        # bicicletas por encima del minimo.
+        variacion = self.prevision(hora) if hora is not None else {}
+        excedentes = []
+        deficits = []
+        holguras = []
+        reservas = []
+        for estacion in estaciones:
+            previstas = len(estacion.bicicletas) + round(variacion.get(estacion, 0))
+            minimo = ceil(estacion.capacidad * ocupacion_min)
+            maximo = floor(estacion.capacidad * ocupacion_max)
+            if previstas > maximo:
+                excedentes.append((-min(previstas - maximo, len(estacion.bicicletas)), id(estacion), estacion))
+            elif previstas < minimo:
+                deficits.append((-min(minimo - previstas, estacion.estacionamientosLibres()), id(estacion), estacion))
+            else:
+                holguras.append((-min(maximo - previstas, estacion.estacionamientosLibres()), id(estacion), estacion))
+                reservas.append((-min(previstas - minimo, len(estacion.bicicletas)), id(estacion), estacion))
+        plan = []
+        self.emparejarFlujos(excedentes, deficits, plan)
+        if excedentes:
+            self.emparejarFlujos(excedentes, holguras, plan)
+        elif deficits:
+            self.emparejarFlujos(reservas, deficits, plan)
+        return plan
+
+    @staticmethod
+    def emparejarFlujos(origenes, destinos, plan) -> None:
+        # origenes y destinos son heaps de (-cantidad, id, estacion); lo que no
+        # se empareja queda en ellos.
+        heapq.heapify(origenes)
+        heapq.heapify(destinos)
+        while origenes and destinos:
+            sobrante, id_origen, origen = heapq.heappop(origenes)
+            faltante, id_destino, destino = heapq.heappop(destinos)
+            cantidad = min(-sobrante, -faltante)
+            if cantidad <= 0:
+                if sobrante < 0:
+                    heapq.heappush(origenes, (sobrante, id_origen, origen))
+                break
+            plan.append((origen, destino, cantidad))
+            if -sobrante > cantidad:
+                heapq.heappush(origenes, (sobrante + cantidad, id_origen, origen))
+            if -faltante > cantidad:
+                heapq.heappush(destinos, (faltante + cantidad, id_destino, destino))
+
+class Sistema:
+
+    def __init__(self):
+        self.estaciones: List[Estacion] = []
+        self.usos: List[Uso] = []
+        self.cola_pagos: ColaPagos = None
+        self.analitica: AnaliticaDemanda = AnaliticaDemanda()
+
+    def asignarColaPagos(self, cola_pagos) -> ColaPagos:
+        self.cola_pagos = cola_pagos
+        return cola_pagos
+
+    def registrarEstacion(self, ubicacion, capacidad) -> Estacion:
+        estacion = Estacion(ubicacion, capacidad)
+        self.estaciones.append(estacion)
+        return estacion
+        
+    def iniciarUso(self, usuario, bicicleta, estacion, fecha_hora) -> Uso: 
+        uso = Uso(usuario, bicicleta, estacion, fecha_hora)
+        self.usos.append(uso)
+        return uso
+
+    def finalizarUso(self, uso, estacion, fecha_hora):
+        uso.finalizarUso(estacion, fecha_hora, self.cola_pagos)
+        self.analitica.registrarUso(uso)
+
+    def retirarBicicleta(self, usuario, estacion, fecha_hora, bicicleta = None) -> Uso | None:
+        # Sacar la bicicleta e iniciar el uso bajo el mismo lock evita que dos
+        # usuarios retiren la misma bicicleta a la vez.
+        with estacion.lock:
+            if bicicleta is None:
+                if not estacion.bicicletaDisponible():
+                    print(f"Error: No hay bicicletas disponibles en {estacion.ubicacion}")
+                    return None
+                bicicleta = estacion.bicicletas[-1]
+            if not estacion.sacarBicicleta(bicicleta):
+                return None
+            return self.iniciarUso(usuario, bicicleta, estacion, fecha_hora)
+
+    def devolverBicicleta(self, uso, estacion, fecha_hora) -> bool:
+        # Comprobar que el uso sigue abierto, estacionar y cerrarlo bajo el
+        # lock del uso impide devolver dos veces la misma bicicleta. Si el
+        # usuario reservo lugar en la estacion, se usa su reserva.
+        with uso.lock:
+            if not uso.bicicletaEnUso():
+                print(f"Error: El uso de {uso.usuario.nombre} ya fue finalizado")
+                return False
+            if not estacion.estacionarBicicleta(uso.bicicleta, uso.usuario):
+                return False
+            self.finalizarUso(uso, estacion, fecha_hora)
+            return True
+
+    def rebalancear(self, origen, destino, cantidad) -> bool:
+        # Se bloquean ambas estaciones siempre en el mismo orden para evitar
+        # interbloqueos entre rebalanceos cruzados; el movimiento es todo o nada.
+        if origen is destino:
+            return False
+        primera, segunda = sorted((origen, destino), key=id)
+        with primera.lock, segunda.lock:
+            if len(origen.bicicletas) < cantidad or destino.estacionamientosLibres() < cantidad:
+                print(f"Error: No se pueden mover {cantidad} bicicletas de {origen.ubicacion} a {destino.ubicacion}")
+                return False
+            movidas = origen.bicicletas[len(origen.bicicletas) - cantidad:]
+            del origen.bicicletas[len(origen.bicicletas) - cantidad:]
+            destino.bicicletas.extend(movidas)
+            return True
+
+    def planRebalanceo(self, hora = None, ocupacion_min = 0.2, ocupacion_max = 0.8) -> List[tuple]:
+        return self.analitica.planRebalanceo(self.estaciones, hora, ocupacion_min, ocupacion_max)
+
+    def ejecutarPlanRebalanceo(self, plan) -> int:
+        movidas = 0
+        for origen, destino, cantidad in plan:
+            if self.rebalancear(origen, destino, cantidad):
+                movidas += cantidad
+        return movidas
+
+    def estacionamientoDisponibleEn(self) -> None:
+        print("Estaciones con estacionamiento(s) disponible:")
+        for estacion in self.estaciones:
+            if estacion.estacionamientoDisponible():
+                print(f" [{estacion.ubicacion}]")
+
+    def bicicletaDisponibleEn(self) -> None:
+        print("Estaciones con bicicleta(s) disponible:")
+        for estacion in self.estaciones:
+            if estacion.bicicletaDisponible():
+                print(f" [{estacion.ubicacion}]")
+
+if __name__ == "__main__":
+    sistema = Sistema()
+    estacion1 = sistema.registrarEstacion("Estacion A", 5)
+    estacion2 = sistema.registrarEstacion("Estacion B", 10)
+
+    usuario1 = Usuario("1", "U1", "-", "1", AbonoAnual(date.today()))
+    usuario2 = Usuario("2", "U2", "-", "2", AbonoPrePago(100))
+    usuario3 = Usuario("3", "U3", "-", "3", AbonoTuristico(date.today()))
+
+    bicicleta1 = estacion1.registrarBicicleta("B001")
+    bicicleta2 = estacion1.registrarBicicleta("B002")
+    bicicleta3 = estacion1.registrarBicicleta("B003")
+
+    uso1 = sistema.iniciarUso(usuario1, bicicleta1, estacion1, datetime.now())
+    uso2 = sistema.iniciarUso(usuario2, bicicleta2, estacion1, datetime.now())
+    uso3 = sistema.iniciarUso(usuario3, bicicleta3, estacion1, datetime.now())
+
+    sistema.finalizarUso(uso1, estacion2, datetime.now() + timedelta(minutes = 59))
+    sistema.finalizarUso(uso2, estacion2, datetime.now() + timedelta(minutes = 59))
+    sistema.finalizarUso(uso3, estacion2, datetime.now() + timedelta(minutes = 59))
+
+    sistema.bicicletaDisponibleEn()
+    sistema.estacionamientoDisponibleEn()
@@ -0,0 +1,477 @@
+from datetime import date, timedelta
+from abc import ABC, abstractmethod
+from array import array
+from bisect import insort
+from collections import deque
+from itertools import combinations, count
+import heapq
+
+class Proyectista:
+    def __init__(self, nombre, email):
+        self.nombre = nombre
+        self.email = email
+
+class Freelancer:
+    def __init__(self, nombre, email, precio_hora, categorias):
+        self.nombre = nombre
+        self.email = email
+        self.categorias = categorias
+        self.puntos = 0
+        self.reputacion = HistorialReputacion()
+        # Proyectos con ofertas de este freelancer (dict usado como conjunto):
+        # si cambia precio_hora, sus libros de ofertas se reordenan.
+        self.proyectos_ofertados = {}
+        self._precio_hora = precio_hora
+
+    @property
+    def precio_hora(self):
+        return self._precio_hora
+
+    @precio_hora.setter
+    def precio_hora(self, precio_hora):
+        self._precio_hora = precio_hora
+        for proyecto in self.proyectos_ofertados:
+            proyecto.invalidar_puntajes()
+
+    def agregar_puntos(self, puntos):
+        self.puntos += puntos
+
+class HistorialReputacion:
+    def __init__(self, ventana=10):
+        # Registro de solo anexado en columnas compactas (proyecto, puntaje,
+        # fecha_finalizacion como ordinal) con agregados que se mantienen al
+        # anexar: media, cantidad y media de los ultimos `ventana` proyectos.
+        self.proyectos = []
+        self.puntajes = array('d')
+        self.fechas = array('l')
+        self.total = 0
+        self.recientes = deque(maxlen=ventana)
+        self.total_recientes = 0
+
+    def registrar(self, proyecto, puntaje, fecha_finalizacion):
+        # Lo que puede fallar (tipo del puntaje o de la fecha) va primero,
+        # para no dejar las columnas desalineadas.
+        fecha = fecha_finalizacion.toordinal()
+        self.puntajes.append(puntaje)
+        self.proyectos.append(proyecto)
+        self.fechas.append(fecha)
+        self.total += puntaje
+        if len(self.recientes) == self.recientes.maxlen:
+            self.total_recientes -= self.recientes[0]
+        self.recientes.append(puntaje)
+        self.total_recientes += puntaje
+
+    def cantidad(self):
+        return len(self.puntajes)
+
+    def media(self):
+        return self.total / len(self.puntajes) if self.puntajes else 0
+
+    def media_reciente(self):
+        return self.total_recientes / len(self.recientes) if self.recientes else 0
+
+    def entradas(self):
+        return [
+            (proyecto, puntaje, date.fromordinal(fecha))
+            for proyecto, puntaje, fecha in zip(self.proyectos, self.puntajes, self.fechas)
+        ]
+
+class Proyecto:
+    def __init__(self, nombre, descripcion, fecha_limite_ofertas, categorias):
+        self.nombre = nombre
+        self.descripcion = descripcion
+        self.fecha_limite_ofertas = fecha_limite_ofertas
+        self.categorias = categorias
+        self.ofertas = []
+        self.oferta_ganadora = None
+        self.finalizado = False
+        self.fecha_finalizacion = None
+        self.ofertas_cerradas = False
+        # Libro de ofertas ordenado por puntaje: (puntaje, secuencia, oferta).
+        # El puntaje depende de fecha_limite_ofertas y del precio_hora de los
+        # freelancers, asi que se recalcula entero solo si alguno cambia.
+        self.libro_ofertas = []
+        self.fecha_puntajes = fecha_limite_ofertas
+        self.secuencia_ofertas = count()
+        self.planificador = None
+        self.vencimiento_programado = None
+
+    def agregar_oferta(self, oferta):
+        if self.ofertas_cerradas or oferta.fecha_oferta > self.fecha_limite_ofertas:
+            raise ValueError("El plazo de ofertas del proyecto ha finalizado.")
+        self.ofertas.append(oferta)
+        oferta.freelancer.proyectos_ofertados[self] = None
+        self._actualizar_libro()
+        insort(self.libro_ofertas, (oferta.puntaje(self.fecha_limite_ofertas), next(self.secuencia_ofertas), oferta))
+
+    def recomendar_ofertas(self):
+        return self.mejores_ofertas(len(self.ofertas))
+
+    def mejores_ofertas(self, k):
+        self._actualizar_libro()
+        return [oferta for _, _, oferta in self.libro_ofertas[:k]]
+
+    def pagina_ofertas(self, pagina, tamano=20):
+        self._actualizar_libro()
+        inicio = pagina * tamano
+        return [oferta for _, _, oferta in self.libro_ofertas[inicio:inicio + tamano]]
+
+    def invalidar_puntajes(self):
+        self.fecha_puntajes = None
+
+    def _actualizar_libro(self):
+        if self.fecha_puntajes == self.fecha_limite_ofertas:
+            return
+        self.fecha_puntajes = self.fecha_limite_ofertas
+        self.libro_ofertas = sorted(
+            (oferta.puntaje(self.fecha_limite_ofertas), secuencia, oferta)
+            for _, secuencia, oferta in self.libro_ofertas
+        )
+
+    def actualizar_plazo(self, fecha_limite_ofertas):
+        # Cambia la fecha limite y la reprograma en el planificador, tanto si
+        # se adelanta como si se atrasa.
+        self.fecha_limite_ofertas = fecha_limite_ofertas
+        if self.planificador is not None and not self.ofertas_cerradas:
+            self.planificador.programar(self)
+
+    def cerrar_ofertas(self):
+        self.ofertas_cerradas = True
+
+    def asignar_oferta(self, oferta):
+        if oferta in self.ofertas:
+            self.oferta_ganadora = oferta
+        else:
+            raise ValueError("La oferta no pertenece al proyecto.")
+
+    def get_freelancer_asignado(self):
+        if self.oferta_ganadora:
+            return self.oferta_ganadora.freelancer
+        return None
+
+    def registrar_finalizacion(self, puntaje, fecha_finalizacion):
+        if self.oferta_ganadora is None:
+            raise ValueError("No hay freelancer asignado al proyecto.")
+        if not (1 <= puntaje <= 50):
+            raise ValueError("El puntaje debe estar entre 1 y 50.")
+        self.oferta_ganadora.freelancer.reputacion.registrar(self, puntaje, fecha_finalizacion)
+        self.finalizado = True
+        self.fecha_finalizacion = fecha_finalizacion
+        self.oferta_ganadora.freelancer.agregar_puntos(puntaje)
+
+class Oferta(ABC):
+    def __init__(self, freelancer, fecha_oferta):
+        self.freelancer = freelancer
+        self.fecha_oferta = fecha_oferta
+
+    @abstractmethod
+    def precio_final(self):
+        pass
+
+    @abstractmethod
+    def dias_entrega(self, fecha_inicio):
+        pass
+
+    def puntaje(self, fecha_inicio):
+        dias = self.dias_entrega(fecha_inicio)
+        if dias <= 0:
+            return float('inf')
+        return self.precio_final() / dias
+
+class OfertaPorHora(Oferta):
+    def __init__(self, freelancer, fecha_oferta, horas_estimadas, fecha_entrega_estimada):
+        super().__init__(freelancer, fecha_oferta)
+        self.horas_estimadas = horas_estimadas
+        self.fecha_entrega_estimada = fecha_entrega_estimada
+
+    def precio_final(self):
+        return self.horas_estimadas * self.freelancer.precio_hora
+
+    def dias_entrega(self, fecha_inicio):
+        delta = self.fecha_entrega_estimada - fecha_inicio
+        return delta.days
+
+class OfertaPorPosicion(Oferta):
+    def __init__(self, freelancer, fecha_oferta, sueldo_mensual, horas_por_mes, meses):
+        super().__init__(freelancer, fecha_oferta)
+        self.sueldo_mensual = sueldo_mensual
+        self.horas_por_mes = horas_por_mes
+        self.meses = meses
+
+    def precio_final(self):
+        return self.sueldo_mensual * self.meses
+
+    def dias_entrega(self, fecha_inicio):
+        return self.meses * 30
+
+class Plataforma:
+    def __init__(self):
+        self.proyectistas = []
+        self.freelancers = []
+        self.proyectos = []
+        self.proyectos_por_categoria = {}
+        self.freelancers_por_categoria = {}
+        self.proyectistas_por_email = {}
+        self.freelancers_por_email = {}
+        self.planificador_ofertas = PlanificadorOfertas()
+
+    def registrar_proyectista(self, nombre, email):
+        if email in self.proyectistas_por_email:
+            raise ValueError("Ya existe un proyectista con ese email.")
+        p = Proyectista(nombre, email)
+        self.proyectistas.append(p)
+        self.proyectistas_por_email[email] = p
+        return p
+
+    def registrar_freelancer(self, nombre, email, precio_hora, categorias):
+        if email in self.freelancers_por_email:
+            raise ValueError("Ya existe un freelancer con ese email.")
+        f = Freelancer(nombre, email, precio_hora, categorias)
+        self.freelancers.append(f)
+        self.freelancers_por_email[email] = f
+        self._indexar(self.freelancers_por_categoria, f, categorias)
+        return f
+
+    def buscar_proyectista(self, email):
+        return self.proyectistas_por_email.get(email)
+
+    def buscar_freelancer(self, email):
+        return self.freelancers_por_email.get(email)
+
+    def registrar_proyecto(self, nombre, descripcion, fecha_limite_ofertas, categorias):
+        pr = Proyecto(nombre, descripcion, fecha_limite_ofertas, categorias)
+        self.proyectos.append(pr)
+        self._indexar(self.proyectos_por_categoria, pr, categorias)
+        self.planificador_ofertas.programar(pr)
+        return pr
+
+    def registrar_oferta(self, proyecto, oferta):
+        proyecto.agregar_oferta(oferta)
+
+    def actualizar_plazo_proyecto(self, proyecto, fecha_limite_ofertas):
+        proyecto.actualizar_plazo(fecha_limite_ofertas)
+
+    def buscar_proyecto_por_categoria(self, categoria):
+        return list(self.proyectos_por_categoria.get(categoria, ()))
+
+    def buscar_freelancer_por_categoria(self, categoria):
+        return list(self.freelancers_por_categoria.get(categoria, ()))
+
+    def buscar_proyectos(self, categorias, todas=True):
+        return self._buscar(self.proyectos_por_categoria, categorias, todas)
+
+    def buscar_freelancers(self, categorias, todas=True):
+        return self._buscar(self.freelancers_por_categoria, categorias, todas)
+
+    @staticmethod
+    def _indexar(indice, entidad, categorias):
+        # Cada categoria apunta a un dict usado como conjunto ordenado, asi se
+        # conserva el orden de registro que devolvian las busquedas lineales.
+        for categoria in categorias:
+            indice.setdefault(categoria, {})[entidad] = None
+
+    @staticmethod
+    def _buscar(indice, categorias, todas):
+        # todas=True es un AND (interseccion), todas=False un OR (union). La
+        # interseccion parte de la lista mas corta, asi que cuesta lo que mide
+        # esa lista y no el total de entidades.
+        listas = [indice.get(categoria, {}) for categoria in categorias]
+        if not listas:
+            return []
+        if not todas:
+            union = {}
+            for lista in listas:
+                union.update(lista)
+            return list(union)
+        listas.sort(key=len)
+        return [e for e in listas[0] if all(e in lista for lista in listas[1:])]
+
+    def recomendar_ofertas(self, proyecto):
+        return proyecto.recomendar_ofertas()
+
+    def asignar_oferta_a_proyecto(self, proyecto, oferta):
+        proyecto.asignar_oferta(oferta)
+
+    def get_freelancer_asignado(self, proyecto):
+        return proyecto.get_freelancer_asignado()
+
+    def registrar_finalizacion_proyecto(self, proyecto, puntaje, fecha_finalizacion):
+        proyecto.registrar_finalizacion(puntaje, fecha_finalizacion)
+
+    def cerrar_ofertas_vencidas(self, hoy, asignar_mejor=False):
+        return self.planificador_ofertas.tick(hoy, asignar_mejor)
+
+    def proyectos_abiertos(self):
+        return [p for p in self.proyectos if not p.finalizado and p.oferta_ganadora is None]
+
+    def emparejar_freelancers(self, n=10):
+        return MotorEmparejamiento(self).emparejar(n)
+
+class PlanificadorOfertas:
+    def __init__(self):
+        self.vencimientos = []
+        self.secuencia = count()
+
+    def programar(self, proyecto):
+        proyecto.planificador = self
+        proyecto.vencimiento_programado = proyecto.fecha_limite_ofertas
+        heapq.heappush(self.vencimientos, (proyecto.fecha_limite_ofertas, next(self.secuencia), proyecto))
+
+    def tick(self, hoy, asignar_mejor=False):
+        # Cierra las ofertas de los proyectos cuyo plazo termino antes de hoy.
+        # Solo se miran los vencimientos del heap, no todos los proyectos.
+        # actualizar_plazo agrega una entrada nueva y las anteriores quedan
+        # obsoletas; si la fecha se cambio sin ese metodo, se reprograma aqui.
+        cerrados = []
+        while self.vencimientos and self.vencimientos[0][0] < hoy:
+            fecha, _, proyecto = heapq.heappop(self.vencimientos)
+            if proyecto.ofertas_cerradas or fecha != proyecto.vencimiento_programado:
+                continue
+            if proyecto.fecha_limite_ofertas != fecha:
+                self.programar(proyecto)
+                continue
+            proyecto.cerrar_ofertas()
+            if asignar_mejor and proyecto.oferta_ganadora is None and proyecto.ofertas:
+                proyecto.asignar_oferta(proyecto.mejores_ofertas(1)[0])
+            cerrados.append(proyecto)
+        return cerrados
+
+class MotorEmparejamiento:
+    # Listas por combinacion de hasta max_nivel categorias (una, un par, un
+    # trio...): cada freelancer esta en las de todas las combinaciones de sus
+    # categorias, ordenado de mayor a menor base.
+    max_nivel = 3
+
+    def __init__(self, plataforma, peso_categorias=1.0, peso_precio=0.5, peso_puntos=0.5):
+        self.plataforma = plataforma
+        self.peso_categorias = peso_categorias
+        self.peso_precio = peso_precio
+        self.peso_puntos = peso_puntos
+        self.base = {}
+        self.ordenados_por_combinacion = {}
+
+    def preparar(self):
+        # Parte del puntaje que solo depende del freelancer (precio y puntos
+        # normalizados), calculada una vez por corrida para todos, y las
+        # listas por combinacion de categorias ordenadas por esa parte, con
+        # sus bases en una lista paralela.
+        freelancers = self.plataforma.freelancers
+        max_precio = max((f.precio_hora for f in freelancers), default=0) or 1
+        max_puntos = max((f.puntos for f in freelancers), default=0) or 1
+        self.base = {
+            f: self.peso_puntos * f.puntos / max_puntos - self.peso_precio * f.precio_hora / max_precio
+            for f in freelancers
+        }
+        por_combinacion = {}
+        for f in sorted(freelancers, key=self.base.__getitem__, reverse=True):
+            categorias = sorted(set(f.categorias))
+            for nivel in range(1, min(len(categorias), self.max_nivel) + 1):
+                for combinacion in combinations(categorias, nivel):
+                    por_combinacion.setdefault(combinacion, []).append(f)
+        self.ordenados_por_combinacion = {
+            combinacion: (lista, [self.base[f] for f in lista])
+            for combinacion, lista in por_combinacion.items()
+        }
+
+    def candidatos(self, proyecto, n=10):
+        # Puntaje = peso_categorias * fraccion de categorias compartidas + base.
+        # Quien comparte exactamente k categorias del proyecto esta en la lista
+        # de esas k (o en las de max_nivel si k es mayor), asi que su puntaje
+        # no supera peso * k + su base. Se recorren las listas de las
+        # combinaciones del proyecto en orden de esa cota (un heap con la
+        # siguiente de cada lista) y se para cuando la mayor cota pendiente no
+        # supera al n-esimo mejor: no se puntua a toda la union de categorias.
+        if not self.ordenados_por_combinacion:
+            self.preparar()
+        categorias = set(proyecto.categorias)
+        presentes = sorted(c for c in categorias if (c,) in self.ordenados_por_combinacion)
+        if not presentes or n <= 0:
+            return []
+        peso = self.peso_categorias / len(categorias)
+        listas = []
+        frentes = []
+        for nivel in range(1, min(len(presentes), self.max_nivel) + 1):
+            compartidas = nivel if nivel < self.max_nivel else len(presentes)
+            for combinacion in combinations(presentes, nivel):
+                lista = self.ordenados_por_combinacion.get(combinacion)
+                if lista is not None:
+                    frentes.append((-(peso * compartidas + lista[1][0]), len(listas), 0))
+                    listas.append((lista[0], lista[1], peso * compartidas))
+        heapq.heapify(frentes)
+        vistos = set()
+        mejores = []
+        secuencia = count()
+        while frentes and (len(mejores) < n or -frentes[0][0] > mejores[0][0]):
+            _, i, posicion = heapq.heappop(frentes)
+            freelancers, bases, extra = listas[i]
+            if posicion + 1 < len(freelancers):
+                heapq.heappush(frentes, (-(extra + bases[posicion + 1]), i, posicion + 1))
+            f = freelancers[posicion]
+            if f in vistos:
+                continue
+            vistos.add(f)
+            candidato = (peso * len(categorias.intersection(f.categorias)) + bases[posicion], -next(secuencia), f)
+            if len(mejores) < n:
+                heapq.heappush(mejores, candidato)
+            elif candidato[0] > mejores[0][0]:
+                heapq.heapreplace(mejores, candidato)
+        return [(f, puntaje) for puntaje, _, f in sorted(mejores, reverse=True)]
+
+    def emparejar(self, n=10):
+        self.preparar()
+        return {proyecto: self.candidatos(proyecto, n) for proyecto in self.plataforma.proyectos_abiertos()}
+
+if __name__ == "__main__":
+    plataforma = Plataforma()
+    proyectista1 = plataforma.registrar_proyectista("Sergio Firmenich", "sergio@example.com")
+    freelancer1 = plataforma.registrar_freelancer("Alejandro Taylor", "alex@example.com", 20, ["Desarrollo Web", "Diseño Gráfico"])
+    freelancer2 = plataforma.registrar_freelancer("Carlos Rangel", "carlos@example.com", 25, ["Desarrollo Web"])
+    proyecto1 = plataforma.registrar_proyecto(
+        "Aplicación Web",
+        "Desarrollo de una aplicación web para e-commerce",
+        date(2025, 3, 1),
+        ["Desarrollo Web"]
+    )
+    oferta1 = OfertaPorHora(
+        freelancer1,
+        fecha_oferta=date(2025, 2, 20),
+        horas_estimadas=100,
+        fecha_entrega_estimada=date(2025, 4, 1)
+    )
+    oferta2 = OfertaPorPosicion(
+        freelancer2,
+        fecha_oferta=date(2025, 2, 21),
+        sueldo_mensual=2000,
+        horas_por_mes=160,
+        meses=2
+    )
+    plataforma.registrar_oferta(proyecto1, oferta1)
+    plataforma.registrar_oferta(proyecto1, oferta2)
+    print("Ofertas recomendadas ordenadas por puntaje:")
+    for oferta in plataforma.recomendar_ofertas(proyecto1):
+        if isinstance(oferta, OfertaPorHora):
+            print("OfertaPorHora - Freelancer:", oferta.freelancer.nombre, 
+                  "Horas estimadas:", oferta.horas_estimadas, 
+                  "Fecha entrega:", oferta.fecha_entrega_estimada, 
+                  "Puntaje:", f"{oferta.puntaje(proyecto1.fecha_limite_ofertas):.2f}")
+        elif isinstance(oferta, OfertaPorPosicion):
+            print("OfertaPorPosicion - Freelancer:", oferta.freelancer.nombre, 
+                  "Sueldo mensual:", oferta.sueldo_mensual, 
+                  "Meses:", oferta.meses, 
+                  "Puntaje:", f"{oferta.puntaje(proyecto1.fecha_limite_ofertas):.2f}")
+    ofertas_recomendadas = plataforma.recomendar_ofertas(proyecto1)
+    plataforma.asignar_oferta_a_proyecto(proyecto1, ofertas_recomendadas[0])
+    freelancer_asignado = plataforma.get_freelancer_asignado(proyecto1)
+    
+    if freelancer_asignado:
+        print("\nFreelancer asignado al proyecto:", freelancer_asignado.nombre)
+    else:
+        print("\nNo hay freelancer asignado al proyecto.")
+        
+    plataforma.registrar_finalizacion_proyecto(proyecto1, puntaje=40, fecha_finalizacion=date(2025, 4, 15))
+    print("\nProyecto finalizado:", proyecto1.finalizado, "- Fecha finalización:", proyecto1.fecha_finalizacion)
+    print("Puntos actuales del freelancer asignado:", freelancer_asignado.puntos)
+    proyectos_devweb = plataforma.buscar_proyecto_por_categoria("Desarrollo Web")
+    print("\nProyectos en la categoría 'Desarrollo Web':", [p.nombre for p in proyectos_devweb])
+    freelancers_devweb = plataforma.buscar_freelancer_por_categoria("Desarrollo Web")
+    print("Freelancers en la categoría 'Desarrollo Web':", [f.nombre for f in freelancers_devweb])
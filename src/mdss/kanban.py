@@ -0,0 +1,747 @@
+from datetime import date, timedelta
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right, insort
+from itertools import count
+import json
+import os
+
+class Persona:
+    def __init__(self, nombre: str, email: str):
+        self.nombre = nombre
+        self.email = email
+        self.puntaje = 0
+
+class Asignacion:
+    __slots__ = ("desarrollador", "fecha_inicio", "fecha_fin")
+
+    def __init__(self, desarrollador: Persona, fecha_inicio: date):
+        self.desarrollador = desarrollador
+        self.fecha_inicio = fecha_inicio
+        self.fecha_fin = None
+
+    def cerrar(self, fecha: date):
+        self.fecha_fin = fecha
+
+class TareaBase(ABC):
+    # Secuencia global de creacion: desempata tareas del mismo dia en los
+    # indices de Sistema.
+    contador = count()
+
+    def __init__(self, titulo: str, descripcion: str, complejidad: int, fecha_limite: date):
+        self.titulo = titulo
+        self.descripcion = descripcion
+        self.complejidad = max(1, min(5, complejidad))
+        self.fecha_limite = fecha_limite
+        self.fecha_creacion = date.today()
+        self.fecha_cierre = None
+        self.asignaciones = []
+        self.tablero = None
+        self.id = None
+        self.secuencia = next(TareaBase.contador)
+
+    def asignar(self, desarrollador: Persona, fecha: date = None):
+        hoy = fecha or date.today()
+        self.cerrar_asignacion_actual(hoy)
+        self.asignaciones.append(Asignacion(desarrollador, hoy))
+        if self.tablero is not None:
+            self.tablero.tarea_asignada(self, desarrollador)
+
+    def cerrar(self, fecha: date = None):
+        hoy = fecha or date.today()
+        self.fecha_cierre = hoy
+        self.cerrar_asignacion_actual(hoy)
+        if self.tablero is not None:
+            self.tablero.registrar_cierre(self)
+
+    def cerrar_asignacion_actual(self, fecha: date):
+        if self.asignaciones and self.asignaciones[-1].fecha_fin is None:
+            self.asignaciones[-1].cerrar(fecha)
+            if self.tablero is not None and self.tablero.metricas is not None:
+                self.tablero.metricas.asignacion_cerrada(self.asignaciones[-1])
+
+    def esta_cerrada(self) -> bool:
+        return self.fecha_cierre is not None
+
+    def se_cerro_a_tiempo(self) -> bool:
+        return self.esta_cerrada() and self.fecha_cierre <= self.fecha_limite
+
+    def obtener_desarrollador_actual(self):
+        return self.asignaciones[-1].desarrollador if self.asignaciones else None
+
+    @abstractmethod
+    def puntaje_desarrollador(self) -> int:
+        pass
+
+class TareaDIU(TareaBase):
+    def puntaje_desarrollador(self) -> int:
+        return 2 * self.complejidad if self.se_cerro_a_tiempo() else 1
+
+class TareaProgramacion(TareaBase):
+    def puntaje_desarrollador(self) -> int:
+        return self.complejidad ** 2 if self.se_cerro_a_tiempo() else 0
+
+class Lista:
+    def __init__(self, titulo: str):
+        self.titulo = titulo
+        # Lista doblemente enlazada sobre un dict tarea -> [anterior, siguiente]:
+        # pertenencia, insercion junto a otra tarjeta y borrado en O(1). Si
+        # pertenece a un tablero, toda alta y baja pasa por agregar_tarea y
+        # remover_tarea, que avisan al tablero (ubicaciones e indices del
+        # sistema); un movimiento entre listas del tablero solo re-enlaza.
+        self.enlaces = {}
+        self.primera = None
+        self.ultima = None
+        self.tablero = None
+
+    @property
+    def tareas(self) -> tuple:
+        # Solo lectura: las altas y bajas van por agregar_tarea y remover_tarea.
+        return tuple(self)
+
+    def __iter__(self):
+        tarea = self.primera
+        while tarea is not None:
+            yield tarea
+            tarea = self.enlaces[tarea][1]
+
+    def __len__(self) -> int:
+        return len(self.enlaces)
+
+    def __contains__(self, tarea: TareaBase) -> bool:
+        return tarea in self.enlaces
+
+    def agregar_tarea(self, tarea: TareaBase, antes_de: TareaBase = None):
+        lista_actual = self if tarea in self.enlaces else None
+        if self.tablero is not None:
+            lista_actual = self.tablero.lista_de(tarea)
+        if lista_actual is not None:
+            lista_actual.desenlazar(tarea)
+        self.enlazar(tarea, antes_de)
+        if self.tablero is None:
+            return
+        if lista_actual is None:
+            self.tablero.tarea_entra(tarea, self)
+        else:
+            self.tablero.ubicaciones[tarea] = self.titulo
+
+    def enlazar(self, tarea: TareaBase, antes_de: TareaBase = None):
+        if antes_de is None or antes_de not in self.enlaces:
+            self.enlaces[tarea] = [self.ultima, None]
+            if self.ultima is None:
+                self.primera = tarea
+            else:
+                self.enlaces[self.ultima][1] = tarea
+            self.ultima = tarea
+            return
+        anterior = self.enlaces[antes_de][0]
+        self.enlaces[tarea] = [anterior, antes_de]
+        self.enlaces[antes_de][0] = tarea
+        if anterior is None:
+            self.primera = tarea
+        else:
+            self.enlaces[anterior][1] = tarea
+
+    def remover_tarea(self, tarea: TareaBase):
+        if tarea not in self.enlaces:
+            return
+        self.desenlazar(tarea)
+        if self.tablero is not None:
+            self.tablero.tarea_sale(tarea)
+
+    def desenlazar(self, tarea: TareaBase):
+        anterior, siguiente = self.enlaces.pop(tarea)
+        if anterior is None:
+            self.primera = siguiente
+        else:
+            self.enlaces[anterior][1] = siguiente
+        if siguiente is None:
+            self.ultima = anterior
+        else:
+            self.enlaces[siguiente][0] = anterior
+
+    def posicion(self, tarea: TareaBase) -> int:
+        for i, actual in enumerate(self):
+            if actual is tarea:
+                return i
+        return -1
+
+class Tablero:
+    def __init__(self, titulo: str, lider: Persona):
+        self.titulo = titulo
+        self.lider = lider
+        self.listas = {}
+        self.cerrado = False
+        self.ubicaciones = {}
+        # Cierres en orden de fecha: ordinales en una lista paralela para
+        # poder buscar con bisect el inicio de la ventana del sprint.
+        self.fechas_cierre = []
+        self.tareas_cerradas = []
+        self.siguiente_id = 1
+        self.historial = None
+        self.metricas = None
+        self.sistema = None
+        self.agregar_lista(Lista("Backlog"))
+
+    def agregar_lista(self, lista: Lista):
+        self.listas[lista.titulo] = lista
+        lista.tablero = self
+        for tarea in lista:
+            self.tarea_entra(tarea, lista)
+
+    def tarea_entra(self, tarea: TareaBase, lista: Lista):
+        # Unico punto de alta de una tarea en el tablero (desde Lista o desde
+        # Tablero); si venia de otro tablero, sale de alli primero.
+        anterior = tarea.tablero
+        if anterior is not None and anterior is not self:
+            lista_anterior = anterior.lista_de(tarea)
+            if lista_anterior is not None:
+                lista_anterior.remover_tarea(tarea)
+        self.ubicaciones[tarea] = lista.titulo
+        self.asignar_id(tarea)
+        if self.sistema is not None:
+            self.sistema.tarea_agregada(tarea)
+
+    def tarea_sale(self, tarea: TareaBase):
+        if self.ubicaciones.pop(tarea, None) is not None and self.sistema is not None:
+            self.sistema.tarea_removida(tarea)
+
+    def tarea_asignada(self, tarea: TareaBase, desarrollador: Persona):
+        if self.sistema is not None and tarea in self.ubicaciones:
+            self.sistema.tarea_asignada(tarea, desarrollador)
+
+    def agregar_tarea_a_lista(self, titulo_lista: str, tarea: TareaBase, antes_de: TareaBase = None):
+        if titulo_lista not in self.listas:
+            self.agregar_lista(Lista(titulo_lista))
+        self.listas[titulo_lista].agregar_tarea(tarea, antes_de)
+        if self.metricas is not None:
+            self.metricas.tarea_en_lista(tarea)
+
+    def asignar_id(self, tarea: TareaBase):
+        # Una tarea que llega ya cerrada tambien entra en el registro de cierres.
+        llega = tarea.tablero is not self
+        tarea.tablero = self
+        if llega and tarea.esta_cerrada():
+            self.registrar_cierre(tarea)
+        if tarea.id is None:
+            tarea.id = self.siguiente_id
+        self.siguiente_id = max(self.siguiente_id, tarea.id + 1)
+
+    def mover_tarea(self, tarea: TareaBase, titulo_lista_destino: str, antes_de: TareaBase = None):
+        titulo_lista = self.ubicaciones.get(tarea)
+        if titulo_lista is None:
+            return False
+        if self.metricas is not None:
+            self.metricas.tarea_sale_de_lista(tarea, titulo_lista)
+        self.agregar_tarea_a_lista(titulo_lista_destino, tarea, antes_de)
+        return True
+
+    def remover_tarea(self, tarea: TareaBase):
+        lista = self.lista_de(tarea)
+        if lista is None:
+            return False
+        lista.remover_tarea(tarea)
+        return True
+
+    def lista_de(self, tarea: TareaBase):
+        titulo_lista = self.ubicaciones.get(tarea)
+        return self.listas[titulo_lista] if titulo_lista is not None else None
+
+    def registrar_cierre(self, tarea: TareaBase):
+        fecha = tarea.fecha_cierre.toordinal()
+        posicion = len(self.fechas_cierre)
+        if self.fechas_cierre and fecha < self.fechas_cierre[-1]:
+            posicion = bisect_left(self.fechas_cierre, fecha + 1)
+        self.fechas_cierre.insert(posicion, fecha)
+        self.tareas_cerradas.insert(posicion, tarea)
+        if self.metricas is not None:
+            self.metricas.tarea_cerrada(tarea)
+        if self.sistema is not None:
+            self.sistema.tarea_cerrada(tarea)
+
+    def cerradas_desde(self, fecha: date) -> list:
+        # Solo recorre la ventana; descarta registros de tareas que se
+        # volvieron a cerrar en otra fecha o que ya no estan en el tablero.
+        inicio = bisect_left(self.fechas_cierre, fecha.toordinal())
+        vistas = set()
+        tareas = []
+        for ordinal, tarea in zip(self.fechas_cierre[inicio:], self.tareas_cerradas[inicio:]):
+            if tarea in vistas or tarea not in self.ubicaciones:
+                continue
+            if tarea.esta_cerrada() and tarea.fecha_cierre.toordinal() == ordinal:
+                vistas.add(tarea)
+                tareas.append(tarea)
+        return tareas
+
+    def puntajes_sprint(self) -> dict:
+        puntajes = {}
+        fecha_limite_sprint = date.today() - timedelta(days=15)
+        for tarea in self.cerradas_desde(fecha_limite_sprint):
+            if tarea.se_cerro_a_tiempo():
+                puntajes[self.lider] = puntajes.get(self.lider, 0) + 1
+            desarrollador = tarea.obtener_desarrollador_actual()
+            if desarrollador:
+                puntajes[desarrollador] = puntajes.get(desarrollador, 0) + tarea.puntaje_desarrollador()
+        return puntajes
+
+    def cerrar_sprint(self) -> dict:
+        if self.cerrado:
+            return {}
+        self.cerrado = True
+        puntajes = self.puntajes_sprint()
+        for persona, puntaje in puntajes.items():
+            persona.puntaje += puntaje
+        return puntajes
+
+    def obtener_tareas(self) -> list:
+        return [tarea for lista in self.listas.values() for tarea in lista]
+
+class IndiceTareas:
+    # Tareas en orden de creacion: claves (ordinal de fecha_creacion,
+    # secuencia, tarea) en una lista ordenada. Alta y baja con bisect, y cada
+    # pagina empieza despues de un cursor (la ultima tarea vista) en
+    # O(log n + pagina), sin recorrer las anteriores.
+    def __init__(self):
+        self.claves = {}
+        self.orden = []
+
+    def __len__(self) -> int:
+        return len(self.orden)
+
+    def __iter__(self):
+        return (tarea for _, _, tarea in self.orden)
+
+    def __contains__(self, tarea: TareaBase) -> bool:
+        return tarea in self.claves
+
+    def agregar(self, tarea: TareaBase):
+        if tarea in self.claves:
+            return
+        clave = (tarea.fecha_creacion.toordinal(), tarea.secuencia, tarea)
+        self.claves[tarea] = clave
+        insort(self.orden, clave)
+
+    def quitar(self, tarea: TareaBase):
+        clave = self.claves.pop(tarea, None)
+        if clave is not None:
+            del self.orden[bisect_left(self.orden, clave)]
+
+    def pagina(self, despues_de: TareaBase = None, limite: int = None) -> list:
+        inicio = 0
+        if despues_de is not None:
+            # Una tarea ya quitada del indice sigue sirviendo de cursor.
+            clave = self.claves.get(despues_de) or (despues_de.fecha_creacion.toordinal(), despues_de.secuencia)
+            inicio = bisect_right(self.orden, clave)
+        fin = None if limite is None else inicio + limite
+        return [tarea for _, _, tarea in self.orden[inicio:fin]]
+
+class Sistema:
+    def __init__(self):
+        self.tableros = []
+        # Indices globales de las tareas en tableros del sistema: abiertas y
+        # asignadas a cada persona. Los tableros avisan de cada alta, baja,
+        # asignacion y cierre (tarea_agregada, tarea_removida, ...).
+        self.tareas_abiertas = IndiceTareas()
+        self.tareas_por_usuario = {}
+        self.metricas = MetricasCiclo()
+
+    def crear_tablero(self, titulo: str, lider: Persona) -> Tablero:
+        nuevo_tablero = Tablero(titulo, lider)
+        nuevo_tablero.metricas = self.metricas
+        nuevo_tablero.sistema = self
+        self.tableros.append(nuevo_tablero)
+        return nuevo_tablero
+
+    def crear_tarea(self, tablero: Tablero, titulo: str, descripcion: str, complejidad: int, fecha_limite: date, tipo: str) -> TareaBase:
+        if tipo.lower() == "diu":
+            tarea = TareaDIU(titulo, descripcion, complejidad, fecha_limite)
+        elif tipo.lower() == "programacion":
+            tarea = TareaProgramacion(titulo, descripcion, complejidad, fecha_limite)
+        else:
+            raise ValueError("Tipo de tarea desconocido. Use 'DIU' o 'Programacion'.")
+        tablero.agregar_tarea_a_lista("Backlog", tarea)
+        if tablero.historial:
+            tablero.historial.tarea_creada(tarea, "Backlog")
+        return tarea
+
+    def asignar_tarea(self, tarea: TareaBase, desarrollador: Persona) -> TareaBase:
+        tarea.asignar(desarrollador)
+        if tarea.tablero and tarea.tablero.historial:
+            tarea.tablero.historial.tarea_asignada(tarea, desarrollador)
+        return tarea
+
+    def mover_tarea(self, tarea: TareaBase, tablero: Tablero, titulo_lista_destino: str, antes_de: TareaBase = None):
+        movida = tablero.mover_tarea(tarea, titulo_lista_destino, antes_de)
+        if movida and tablero.historial:
+            tablero.historial.tarea_movida(tarea, titulo_lista_destino, antes_de)
+        return movida
+
+    def cerrar_tarea(self, tarea: TareaBase):
+        tarea.cerrar()
+        if tarea.tablero and tarea.tablero.historial:
+            tarea.tablero.historial.tarea_cerrada(tarea)
+
+    def cerrar_sprint(self, tablero: Tablero):
+        if tablero.cerrado:
+            return
+        puntajes = tablero.cerrar_sprint()
+        if tablero.historial:
+            tablero.historial.sprint_cerrado(puntajes)
+
+    def cerrar_sprints(self, tableros: list = None) -> dict:
+        # Cierra varios tableros a la vez y aplica un unico incremento de
+        # puntaje por persona con la suma de todos ellos.
+        totales = {}
+        for tablero in self.tableros if tableros is None else tableros:
+            if tablero.cerrado:
+                continue
+            tablero.cerrado = True
+            puntajes = tablero.puntajes_sprint()
+            for persona, puntaje in puntajes.items():
+                totales[persona] = totales.get(persona, 0) + puntaje
+            if tablero.historial:
+                tablero.historial.sprint_cerrado(puntajes)
+        for persona, puntaje in totales.items():
+            persona.puntaje += puntaje
+        return totales
+
+    def registrar_historial(self, tablero: Tablero, ruta_eventos: str, ruta_snapshot: str, cada: int = 10000):
+        return HistorialTablero.iniciar(tablero, ruta_eventos, ruta_snapshot, cada)
+
+    def cargar_tablero(self, ruta_eventos: str, ruta_snapshot: str, personas: dict = None, cada: int = 10000) -> Tablero:
+        tablero = HistorialTablero.cargar(ruta_eventos, ruta_snapshot, personas, cada).tablero
+        tablero.metricas = self.metricas
+        tablero.sistema = self
+        self.tableros.append(tablero)
+        for tarea in tablero.obtener_tareas():
+            self.tarea_agregada(tarea)
+        return tablero
+
+    def tarea_agregada(self, tarea: TareaBase):
+        if not tarea.esta_cerrada():
+            self.tareas_abiertas.agregar(tarea)
+        for asignacion in tarea.asignaciones:
+            self.tarea_asignada(tarea, asignacion.desarrollador)
+
+    def tarea_asignada(self, tarea: TareaBase, desarrollador: Persona):
+        if desarrollador not in self.tareas_por_usuario:
+            self.tareas_por_usuario[desarrollador] = IndiceTareas()
+        self.tareas_por_usuario[desarrollador].agregar(tarea)
+
+    def tarea_cerrada(self, tarea: TareaBase):
+        self.tareas_abiertas.quitar(tarea)
+
+    def tarea_removida(self, tarea: TareaBase):
+        self.tareas_abiertas.quitar(tarea)
+        for asignacion in tarea.asignaciones:
+            tareas = self.tareas_por_usuario.get(asignacion.desarrollador)
+            if tareas is not None:
+                tareas.quitar(tarea)
+
+    def listar_tareas_pendientes(self, despues_de: TareaBase = None, limite: int = None) -> list:
+        # Paginas por cursor: despues_de es la ultima tarea de la pagina anterior.
+        return self.tareas_abiertas.pagina(despues_de, limite)
+
+    def listar_tareas_usuario(self, usuario: Persona, despues_de: TareaBase = None, limite: int = None) -> list:
+        tareas = self.tareas_por_usuario.get(usuario)
+        return tareas.pagina(despues_de, limite) if tareas is not None else []
+
+class Histograma:
+    # Conteo de duraciones en dias: media y percentiles exactos en
+    # O(valores distintos), sin guardar ni recorrer cada muestra.
+    __slots__ = ("conteos", "total", "cantidad")
+
+    def __init__(self):
+        self.conteos = {}
+        self.total = 0
+        self.cantidad = 0
+
+    def agregar(self, dias: int):
+        self.conteos[dias] = self.conteos.get(dias, 0) + 1
+        self.total += dias
+        self.cantidad += 1
+
+    def media(self) -> float:
+        return self.total / self.cantidad if self.cantidad else 0
+
+    def percentil(self, p: float) -> int:
+        if not self.cantidad:
+            return 0
+        objetivo = max(1, -(-self.cantidad * p // 100))
+        acumulado = 0
+        for dias in sorted(self.conteos):
+            acumulado += self.conteos[dias]
+            if acumulado >= objetivo:
+                return dias
+        return dias
+
+class TiemposTarea:
+    __slots__ = ("entrada_lista", "cerrada")
+
+    def __init__(self, entrada_lista: int):
+        self.entrada_lista = entrada_lista
+        self.cerrada = False
+
+class MetricasCiclo:
+    # Agregados en streaming de tiempos de ciclo (creacion -> cierre) por
+    # tablero, persona y tipo de tarea, de tiempo en asignacion por persona y
+    # de permanencia por lista. Por tarea solo se guarda un TiemposTarea.
+    def __init__(self):
+        self.tiempos = {}
+        self.ciclo_por_tablero = {}
+        self.ciclo_por_persona = {}
+        self.ciclo_por_tipo = {}
+        self.asignacion_por_persona = {}
+        self.permanencia_por_lista = {}
+
+    @staticmethod
+    def agregar(grupo: dict, clave, dias: int):
+        if clave not in grupo:
+            grupo[clave] = Histograma()
+        grupo[clave].agregar(dias)
+
+    def tarea_en_lista(self, tarea: TareaBase):
+        hoy = date.today().toordinal()
+        if tarea in self.tiempos:
+            self.tiempos[tarea].entrada_lista = hoy
+        else:
+            self.tiempos[tarea] = TiemposTarea(hoy)
+
+    def tarea_sale_de_lista(self, tarea: TareaBase, titulo_lista: str):
+        tiempos = self.tiempos.get(tarea)
+        if tiempos is not None:
+            self.agregar(self.permanencia_por_lista, titulo_lista, date.today().toordinal() - tiempos.entrada_lista)
+
+    def tarea_cerrada(self, tarea: TareaBase):
+        tiempos = self.tiempos.setdefault(tarea, TiemposTarea(tarea.fecha_creacion.toordinal()))
+        if tiempos.cerrada:
+            return
+        tiempos.cerrada = True
+        dias = (tarea.fecha_cierre - tarea.fecha_creacion).days
+        self.agregar(self.ciclo_por_tablero, tarea.tablero.titulo, dias)
+        self.agregar(self.ciclo_por_tipo, type(tarea).__name__, dias)
+        desarrollador = tarea.obtener_desarrollador_actual()
+        if desarrollador is not None:
+            self.agregar(self.ciclo_por_persona, desarrollador, dias)
+
+    def asignacion_cerrada(self, asignacion: Asignacion):
+        self.agregar(self.asignacion_por_persona, asignacion.desarrollador, (asignacion.fecha_fin - asignacion.fecha_inicio).days)
+
+    @staticmethod
+    def resumen(grupo: dict, percentiles: tuple = (50, 90)) -> dict:
+        return {
+            clave: {
+                "cantidad": histograma.cantidad,
+                "media": histograma.media(),
+                **{f"p{p}": histograma.percentil(p) for p in percentiles},
+            }
+            for clave, histograma in grupo.items()
+        }
+
+TIPOS_TAREA = {"TareaDIU": TareaDIU, "TareaProgramacion": TareaProgramacion}
+
+class HistorialTablero:
+    # Registro de eventos de un tablero (crear, asignar, mover, cerrar y
+    # cerrar sprint) en un fichero JSON Lines de solo anexado, con snapshots
+    # periodicos del estado completo. El snapshot guarda el offset del fichero
+    # de eventos hasta el que llega, asi que al cargar solo se reproduce la cola.
+    def __init__(self, tablero: Tablero, ruta_eventos: str, ruta_snapshot: str, cada: int, personas: dict):
+        self.tablero = tablero
+        self.ruta_eventos = ruta_eventos
+        self.ruta_snapshot = ruta_snapshot
+        self.cada = cada
+        self.personas = personas
+        self.aportes = {}
+        self.eventos_desde_snapshot = 0
+        self.fichero = None
+        self.tareas = {tarea.id: tarea for tarea in tablero.obtener_tareas()}
+        tablero.historial = self
+
+    @classmethod
+    def iniciar(cls, tablero: Tablero, ruta_eventos: str, ruta_snapshot: str, cada: int = 10000):
+        personas = {tablero.lider.email: tablero.lider}
+        for tarea in tablero.obtener_tareas():
+            for asignacion in tarea.asignaciones:
+                personas[asignacion.desarrollador.email] = asignacion.desarrollador
+        historial = cls(tablero, ruta_eventos, ruta_snapshot, cada, personas)
+        historial.fichero = open(ruta_eventos, "w", encoding="utf-8")
+        historial.guardar_snapshot()
+        return historial
+
+    @classmethod
+    def cargar(cls, ruta_eventos: str, ruta_snapshot: str, personas: dict = None, cada: int = 10000):
+        personas = {} if personas is None else personas
+        with open(ruta_snapshot, encoding="utf-8") as fichero:
+            estado = json.load(fichero)
+        historial = cls(cls.restaurar(estado, personas), ruta_eventos, ruta_snapshot, cada, personas)
+        for email, puntaje in estado["aportes"].items():
+            historial.aportes[email] = puntaje
+            historial.persona({"email": email}).puntaje += puntaje
+        with open(ruta_eventos, "rb") as fichero:
+            fichero.seek(estado["offset"])
+            for linea in fichero:
+                historial.aplicar(json.loads(linea))
+                historial.eventos_desde_snapshot += 1
+        historial.fichero = open(ruta_eventos, "a", encoding="utf-8")
+        return historial
+
+    def cerrar(self):
+        if self.fichero:
+            self.fichero.close()
+            self.fichero = None
+
+    def persona(self, datos: dict) -> Persona:
+        persona = self.personas.get(datos["email"])
+        if persona is None:
+            persona = Persona(datos.get("nombre", datos["email"]), datos["email"])
+            self.personas[datos["email"]] = persona
+        return persona
+
+    def registrar(self, evento: dict):
+        self.fichero.write(json.dumps(evento, ensure_ascii=False) + "\n")
+        self.fichero.flush()
+        self.eventos_desde_snapshot += 1
+        if self.cada and self.eventos_desde_snapshot >= self.cada:
+            self.guardar_snapshot()
+
+    def tarea_creada(self, tarea: TareaBase, titulo_lista: str):
+        self.registrar({
+            "e": "crear", "id": tarea.id, "tipo": type(tarea).__name__, "titulo": tarea.titulo,
+            "descripcion": tarea.descripcion, "complejidad": tarea.complejidad,
+            "fecha_limite": tarea.fecha_limite.isoformat(), "fecha": tarea.fecha_creacion.isoformat(),
+            "lista": titulo_lista,
+        })
+
+    def tarea_asignada(self, tarea: TareaBase, persona: Persona):
+        self.personas[persona.email] = persona
+        self.registrar({
+            "e": "asignar", "id": tarea.id, "persona": {"nombre": persona.nombre, "email": persona.email},
+            "fecha": tarea.asignaciones[-1].fecha_inicio.isoformat(),
+        })
+
+    def tarea_movida(self, tarea: TareaBase, titulo_lista: str, antes_de: TareaBase = None):
+        self.registrar({"e": "mover", "id": tarea.id, "lista": titulo_lista, "antes_de": antes_de.id if antes_de else None})
+
+    def tarea_cerrada(self, tarea: TareaBase):
+        self.registrar({"e": "cerrar", "id": tarea.id, "fecha": tarea.fecha_cierre.isoformat()})
+
+    def sprint_cerrado(self, puntajes: dict):
+        for persona, puntaje in puntajes.items():
+            self.aportes[persona.email] = self.aportes.get(persona.email, 0) + puntaje
+        self.registrar({"e": "sprint", "puntajes": {persona.email: puntaje for persona, puntaje in puntajes.items()}})
+
+    def aplicar(self, evento: dict):
+        tablero = self.tablero
+        tipo = evento["e"]
+        if tipo == "crear":
+            tarea = TIPOS_TAREA[evento["tipo"]](
+                evento["titulo"], evento["descripcion"], evento["complejidad"], date.fromisoformat(evento["fecha_limite"])
+            )
+            tarea.fecha_creacion = date.fromisoformat(evento["fecha"])
+            tarea.id = evento["id"]
+            tablero.agregar_tarea_a_lista(evento["lista"], tarea)
+            self.tareas[tarea.id] = tarea
+        elif tipo == "asignar":
+            self.tareas[evento["id"]].asignar(self.persona(evento["persona"]), date.fromisoformat(evento["fecha"]))
+        elif tipo == "mover":
+            antes_de = self.tareas.get(evento["antes_de"]) if evento["antes_de"] else None
+            tablero.mover_tarea(self.tareas[evento["id"]], evento["lista"], antes_de)
+        elif tipo == "cerrar":
+            self.tareas[evento["id"]].cerrar(date.fromisoformat(evento["fecha"]))
+        elif tipo == "sprint":
+            tablero.cerrado = True
+            for email, puntaje in evento["puntajes"].items():
+                self.persona({"email": email}).puntaje += puntaje
+                self.aportes[email] = self.aportes.get(email, 0) + puntaje
+
+    def guardar_snapshot(self):
+        tablero = self.tablero
+        self.fichero.flush()
+        estado = {
+            "offset": self.fichero.tell(),
+            "titulo": tablero.titulo,
+            "lider": {"nombre": tablero.lider.nombre, "email": tablero.lider.email},
+            "cerrado": tablero.cerrado,
+            "siguiente_id": tablero.siguiente_id,
+            "aportes": self.aportes,
+            "personas": [{"nombre": p.nombre, "email": p.email} for p in self.personas.values()],
+            "listas": [{"titulo": lista.titulo, "tareas": [tarea.id for tarea in lista]} for lista in tablero.listas.values()],
+            "tareas": [
+                {
+                    "id": tarea.id, "tipo": type(tarea).__name__, "titulo": tarea.titulo,
+                    "descripcion": tarea.descripcion, "complejidad": tarea.complejidad,
+                    "fecha_limite": tarea.fecha_limite.isoformat(),
+                    "fecha_creacion": tarea.fecha_creacion.isoformat(),
+                    "fecha_cierre": tarea.fecha_cierre.isoformat() if tarea.fecha_cierre else None,
+                    "asignaciones": [
+                        [a.desarrollador.email, a.fecha_inicio.isoformat(), a.fecha_fin.isoformat() if a.fecha_fin else None]
+                        for a in tarea.asignaciones
+                    ],
+                }
+                for tarea in tablero.obtener_tareas()
+            ],
+            "cierres": [[fecha, tarea.id] for fecha, tarea in zip(tablero.fechas_cierre, tablero.tareas_cerradas)],
+        }
+        temporal = self.ruta_snapshot + ".tmp"
+        with open(temporal, "w", encoding="utf-8") as fichero:
+            json.dump(estado, fichero, ensure_ascii=False)
+        os.replace(temporal, self.ruta_snapshot)
+        self.eventos_desde_snapshot = 0
+
+    @staticmethod
+    def restaurar(estado: dict, personas: dict) -> Tablero:
+        def persona(email, nombre=None):
+            if email not in personas:
+                personas[email] = Persona(nombre or email, email)
+            return personas[email]
+
+        for datos in estado["personas"]:
+            persona(datos["email"], datos["nombre"])
+        tablero = Tablero(estado["titulo"], persona(estado["lider"]["email"], estado["lider"]["nombre"]))
+        tablero.cerrado = estado["cerrado"]
+        tareas = {}
+        for datos in estado["tareas"]:
+            tarea = TIPOS_TAREA[datos["tipo"]](
+                datos["titulo"], datos["descripcion"], datos["complejidad"], date.fromisoformat(datos["fecha_limite"])
+            )
+            tarea.id = datos["id"]
+            tarea.fecha_creacion = date.fromisoformat(datos["fecha_creacion"])
+            tarea.fecha_cierre = date.fromisoformat(datos["fecha_cierre"]) if datos["fecha_cierre"] else None
+            for email, inicio, fin in datos["asignaciones"]:
+                asignacion = Asignacion(persona(email), date.fromisoformat(inicio))
+                asignacion.fecha_fin = date.fromisoformat(fin) if fin else None
+                tarea.asignaciones.append(asignacion)
+            tareas[tarea.id] = tarea
+        for datos in estado["listas"]:
+            lista = Lista(datos["titulo"])
+            for id_tarea in datos["tareas"]:
+                lista.agregar_tarea(tareas[id_tarea])
+            tablero.agregar_lista(lista)
+        tablero.fechas_cierre = [fecha for fecha, _ in estado["cierres"]]
+        tablero.tareas_cerradas = [tareas[id_tarea] for _, id_tarea in estado["cierres"]]
+        tablero.siguiente_id = max(tablero.siguiente_id, estado["siguiente_id"])
+        return tablero
+
+if __name__ == "__main__":
+    lider = Persona("Sergio Firmenich", "sergio@example.com")
+    dev1 = Persona("Alejandro Taylor", "alex@example.com")
+    dev2 = Persona("Carlos Rangel", "carlos@example.com")
+    
+    sistema = Sistema()
+    tablero = sistema.crear_tablero("Proyecto Alpha", lider)
+
+    tarea1 = sistema.crear_tarea(tablero, "Implementar login", "Desarrollar la funcionalidad de login", 3, date(2025, 3, 15), "Programacion")
+    tarea2 = sistema.crear_tarea(tablero, "Diseño de interfaz", "Crear el diseño de la pantalla principal", 2, date(2025, 3, 10), "DIU")
+
+    sistema.asignar_tarea(tarea1, dev1)
+    sistema.asignar_tarea(tarea2, dev2)
+
+    sistema.cerrar_tarea(tarea1)
+    sistema.cerrar_tarea(tarea2)
+
+    sistema.cerrar_sprint(tablero)
+
+    print("Puntaje del líder:", lider.puntaje)
+    print("Puntaje de Alejandro:", dev1.puntaje)
+    print("Puntaje de Carlos:", dev2.puntaje)
+    print("Cantidad de tareas pendientes:", len(sistema.listar_tareas_pendientes()))
+    print("Cantidad de tareas de Alejandro:", len(sistema.listar_tareas_usuario(dev1)))
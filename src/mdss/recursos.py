@@ -0,0 +1,687 @@
+﻿from __future__ import annotations
+from abc import abstractmethod, ABC
+from datetime import date, datetime, timedelta
+from typing import List, Dict
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, Future, wait
+from bisect import bisect_left, insort
+from itertools import count
+from array import array
+from operator import mul
+import csv
+import heapq
+import json
+import threading
+import time
+
+class Usuario:
+    
+    def __init__(self, nombre, email, contraseña):
+        self.nombre: str = nombre
+        self.email: str = email
+        self.contraseña: str = contraseña
+        self.recursos_comprados: List[Recurso] = []
+        self.recursos_liberados: List[Recurso] = []
+
+    def agregarRecursoComprado(self, recurso) -> None:
+        self.recursos_comprados.append(recurso)
+
+    def notificarLiberacion(self, recurso) -> None:
+        self.recursos_liberados.append(recurso)
+
+class Creador(Usuario):
+
+    def __init__(self, nombre, email, contraseña):
+        super().__init__(nombre, email, contraseña)
+        self.puntos: float = 0
+        self.recursos_creados: List[Recurso] = []
+        self.indice_ganancias: IndiceGanancias = None
+
+    def sumarPuntos(self, puntos) -> None:
+        self.puntos += puntos
+        if self.indice_ganancias is not None:
+            self.indice_ganancias.registrarPuntos(self, puntos)
+
+    def agregarRecursoCreado(self, recurso) -> None:
+        self.recursos_creados.append(recurso)
+
+class Recurso:
+
+    def __init__(self, creador, descripcion, imagen, url, fecha_carga, precio_base, estrategia):
+        self.creador: Creador = creador
+        self.descripcion: str = descripcion
+        self.imagen: str = imagen
+        self.url: str = url
+        self.fecha_carga: date = fecha_carga
+        self.precio_base: float = precio_base
+        self.estrategia: Estrategia = estrategia
+        self.num_compras: int = 0
+        self.ingresos: float = 0
+        self.lock: threading.Lock = threading.Lock()
+        self.cache_precio: tuple = None
+
+    def calcularPrecio(self) -> float:
+        return self.precioYPuntos()[0]
+
+    def calcularPuntos(self) -> float:
+        return self.precioYPuntos()[1]
+
+    def precioYPuntos(self) -> tuple:
+        # El par (precio, puntos) se memoriza junto con la estrategia y el
+        # precio base con que se calculo, y con el instante en que caduca (fin
+        # de una oferta); si cambia cualquiera de ellos se recalcula.
+        cache = self.cache_precio
+        if (cache is not None and cache[0] is self.estrategia and cache[1] == self.precio_base
+                and (cache[2] is None or time.time() < cache[2])):
+            return cache[3], cache[4]
+        caducidad = self.estrategia.caducidad()
+        caduca = datetime.combine(caducidad, datetime.min.time()).timestamp() if caducidad else None
+        precio, puntos = self.estrategia.calcularPrecioYPuntos(self.precio_base)
+        self.cache_precio = (self.estrategia, self.precio_base, caduca, precio, puntos)
+        return precio, puntos
+
+    def invalidarPrecio(self) -> None:
+        self.cache_precio = None
+
+    def puedeLiberarRecurso(self) -> bool:
+        return self.estrategia.puedeLiberarRecurso(self.num_compras)
+
+    def incrementarCompra(self, precio = 0) -> int:
+        with self.lock:
+            self.num_compras += 1
+            self.ingresos += precio
+            return self.num_compras
+
+class Estrategia(ABC):
+
+    @abstractmethod
+    def calcularPrecio(self, precio_base) -> float:
+        pass    
+    
+    @abstractmethod
+    def calcularPuntos(self, precio_base) -> float:
+        pass
+
+    @abstractmethod
+    def puedeLiberarRecurso(self, num_compras) -> bool:
+        pass
+
+    def calcularPrecioYPuntos(self, precio_base) -> tuple:
+        return self.calcularPrecio(precio_base), self.calcularPuntos(precio_base)
+
+    def caducidad(self) -> date | None:
+        return None
+
+class EstrategiaNormal(Estrategia):
+    
+    def calcularPrecio(self, precio_base) -> float:
+        return precio_base
+
+    def calcularPuntos(self, precio_base) -> float:
+        return precio_base * 10
+
+    def puedeLiberarRecurso(self, num_compras) -> bool:
+        return True
+
+class EstrategiaOferta(Estrategia):
+
+    def __init__(self, fecha_limite, porcentaje):
+        self.fecha_limite: date = fecha_limite
+        self.porcentaje: float = porcentaje
+
+    def calcularPrecio(self, precio_base) -> float:
+        if self.fecha_limite > date.today():
+            return precio_base * (1 - self.porcentaje / 100)
+        return precio_base
+
+    def calcularPuntos(self, precio_base) -> float:
+        precio_final = self.calcularPrecio(precio_base)
+        if self.fecha_limite > date.today():
+            return precio_final * 5
+        return precio_final * 10
+
+    def calcularPrecioYPuntos(self, precio_base) -> tuple:
+        if self.fecha_limite > date.today():
+            precio_final = precio_base * (1 - self.porcentaje / 100)
+            return precio_final, precio_final * 5
+        return precio_base, precio_base * 10
+
+    def caducidad(self) -> date | None:
+        if self.fecha_limite > date.today():
+            return self.fecha_limite
+        return None
+
+    def puedeLiberarRecurso(self, num_compras) -> bool:
+        return True
+
+class EstrategiaCrowdBased(Estrategia):
+    
+    def __init__(self, usuarios_minimos):
+        self.usuarios_minimos: int = usuarios_minimos
+
+    def calcularPrecio(self, precio_base) -> float:
+        return precio_base
+
+    def calcularPuntos(self, precio_base) -> float:
+        return precio_base * 50 / self.usuarios_minimos
+
+    def puedeLiberarRecurso(self, num_compras) -> bool:
+        return num_compras >= self.usuarios_minimos
+        
+
+def comprarRecurso(usuario, recurso, motor_liberacion = None):
+
+    precio = recurso.calcularPrecio()
+    puntos = recurso.calcularPuntos()
+
+    print(f"Precio: {precio}")
+    print(f"Puntos: {puntos}")
+
+    recurso.incrementarCompra(precio)
+    recurso.creador.sumarPuntos(puntos)
+    usuario.agregarRecursoComprado(recurso)
+    
+    liberado = motor_liberacion.registrarCompra(usuario, recurso) if motor_liberacion else recurso.puedeLiberarRecurso()
+    if liberado:
+        print(f"Compra exitosa. Puedes descargar el recurso desde {recurso.url}.")
+        return
+
+    print(f"Compra en espera. Se necesita un mínimo de {recurso.estrategia.usuarios_minimos} compradores. Actualmente hay {recurso.num_compras}.")
+
+def preciosCatalogo(recursos) -> List[tuple]:
+    return [recurso.precioYPuntos() for recurso in recursos]
+
+class FragmentoRegistro:
+
+    def __init__(self):
+        self.lock: threading.Lock = threading.Lock()
+        self.compras: List[tuple] = []
+        self.puntos_pendientes: Dict[Creador, float] = defaultdict(float)
+
+class RegistroCompras:
+    # Libro de compras de solo anexado para ventas con mucha concurrencia.
+    # Cada hilo escribe en su propio fragmento (con su lock), y los puntos de
+    # los creadores se acumulan ahi hasta que consolidar() los vuelca por lotes
+    # en Creador.puntos, de modo que el creador no es un punto de contencion.
+
+    def __init__(self, num_fragmentos = 16, motor_liberacion = None):
+        self.fragmentos: List[FragmentoRegistro] = [FragmentoRegistro() for _ in range(num_fragmentos)]
+        self.motor_liberacion: MotorLiberacion = motor_liberacion
+        self.lock_consolidacion: threading.Lock = threading.Lock()
+        # Cada hilo recibe un fragmento fijo la primera vez que compra, en
+        # turno rotatorio (los ident de hilo son direcciones alineadas y no
+        # sirven para repartir con un modulo).
+        self._hilo_local: threading.local = threading.local()
+        self._turnos = count()
+        self._detener: threading.Event = threading.Event()
+        self._hilo: threading.Thread = None
+
+    def registrarCompra(self, usuario, recurso) -> bool:
+        precio, puntos = recurso.precioYPuntos()
+        num_compras = recurso.incrementarCompra(precio)
+        usuario.agregarRecursoComprado(recurso)
+        fragmento = self.fragmentoActual()
+        with fragmento.lock:
+            fragmento.compras.append((usuario, recurso, precio, puntos))
+            fragmento.puntos_pendientes[recurso.creador] += puntos
+        if self.motor_liberacion is not None:
+            return self.motor_liberacion.registrarCompra(usuario, recurso)
+        return recurso.estrategia.puedeLiberarRecurso(num_compras)
+
+    def fragmentoActual(self) -> FragmentoRegistro:
+        indice = getattr(self._hilo_local, "fragmento", None)
+        if indice is None:
+            indice = self._hilo_local.fragmento = next(self._turnos) % len(self.fragmentos)
+        return self.fragmentos[indice]
+
+    def fragmentosUsados(self) -> int:
+        return sum(1 for fragmento in self.fragmentos if fragmento.compras)
+
+    def consolidar(self) -> int:
+        with self.lock_consolidacion:
+            totales = defaultdict(float)
+            for fragmento in self.fragmentos:
+                with fragmento.lock:
+                    pendientes = fragmento.puntos_pendientes
+                    fragmento.puntos_pendientes = defaultdict(float)
+                for creador, puntos in pendientes.items():
+                    totales[creador] += puntos
+            for creador, puntos in totales.items():
+                creador.sumarPuntos(puntos)
+            return len(totales)
+
+    def iniciarConsolidacionPeriodica(self, intervalo = 1.0) -> None:
+        if self._hilo is not None:
+            return
+        self._detener.clear()
+        self._hilo = threading.Thread(target=self._consolidarCada, args=(intervalo,), daemon=True)
+        self._hilo.start()
+
+    def detenerConsolidacionPeriodica(self) -> None:
+        if self._hilo is None:
+            return
+        self._detener.set()
+        self._hilo.join()
+        self._hilo = None
+        self.consolidar()
+
+    def numeroCompras(self) -> int:
+        return sum(len(fragmento.compras) for fragmento in self.fragmentos)
+
+    def compras(self) -> List[tuple]:
+        return [compra for fragmento in self.fragmentos for compra in fragmento.compras]
+
+    def _consolidarCada(self, intervalo) -> None:
+        while not self._detener.wait(intervalo):
+            self.consolidar()
+
+
+class MotorLiberacion:
+    # Guarda, por cada recurso crowd-based aun bloqueado, los compradores en
+    # espera. Cuando puedeLiberarRecurso pasa a ser cierto, la lista completa
+    # se retira de una vez y se notifica por lotes en un pool de hilos, sin
+    # bloquear la compra que alcanzo el umbral. Los recursos que se liberan
+    # siempre (estrategia liberable con 0 compras) no toman ningun lock, y
+    # los demas solo el de su recurso.
+
+    def __init__(self, notificador = None, tamano_lote = 1000, max_hilos = 4):
+        self.notificador = notificador or self.notificarLote
+        self.tamano_lote: int = tamano_lote
+        self.esperando: Dict[Recurso, List[Usuario]] = {}
+        self.locks_recurso: Dict[Recurso, threading.Lock] = {}
+        self.lock: threading.Lock = threading.Lock()
+        self.ejecutor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=max_hilos)
+        self.entregas: set = set()
+        self.entregas_fallidas: List[Future] = []
+
+    def registrarCompra(self, usuario, recurso) -> bool:
+        if recurso.estrategia.puedeLiberarRecurso(0) and recurso not in self.esperando:
+            return True
+        with self.lockRecurso(recurso):
+            if not recurso.puedeLiberarRecurso():
+                self.esperando.setdefault(recurso, []).append(usuario)
+                return False
+            pendientes = self.esperando.pop(recurso, None)
+        if pendientes:
+            self.liberar(recurso, pendientes)
+        return True
+
+    def lockRecurso(self, recurso) -> threading.Lock:
+        lock = self.locks_recurso.get(recurso)
+        if lock is None:
+            lock = self.locks_recurso.setdefault(recurso, threading.Lock())
+        return lock
+
+    def liberar(self, recurso, usuarios) -> None:
+        for inicio in range(0, len(usuarios), self.tamano_lote):
+            lote = usuarios[inicio:inicio + self.tamano_lote]
+            entrega = self.ejecutor.submit(self.notificador, recurso, lote)
+            with self.lock:
+                self.entregas.add(entrega)
+            entrega.add_done_callback(self._entregaTerminada)
+
+    def compradoresEnEspera(self, recurso) -> int:
+        return len(self.esperando.get(recurso, ()))
+
+    def esperarEntregas(self) -> None:
+        with self.lock:
+            entregas = list(self.entregas)
+        wait(entregas)
+        with self.lock:
+            fallidas, self.entregas_fallidas = self.entregas_fallidas, []
+        for entrega in fallidas:
+            entrega.result()
+
+    def cerrar(self) -> None:
+        self.esperarEntregas()
+        self.ejecutor.shutdown()
+
+    def _entregaTerminada(self, entrega) -> None:
+        # Las entregas terminadas se sueltan; solo se guardan las que fallaron
+        # para relanzar su error en esperarEntregas.
+        with self.lock:
+            self.entregas.discard(entrega)
+            if not entrega.cancelled() and entrega.exception() is not None:
+                self.entregas_fallidas.append(entrega)
+
+    @staticmethod
+    def notificarLote(recurso, usuarios) -> None:
+        for usuario in usuarios:
+            usuario.notificarLiberacion(recurso)
+
+
+class Clasificacion:
+    # Indice ordenado por puntos con claves (-puntos, secuencia, creador); la
+    # secuencia desempata y evita comparar creadores. Las claves se reparten en
+    # bloques ordenados de tamano acotado, asi que actualizar cuesta O(log n +
+    # tamano_bloque), el top-N O(N) y la posicion de un creador O(raiz de n).
+
+    def __init__(self, tamano_bloque = 512):
+        self.tamano_bloque: int = tamano_bloque
+        self.puntos: Dict[Creador, float] = {}
+        self.claves: Dict[Creador, tuple] = {}
+        self.bloques: List[List[tuple]] = []
+        self.maximos: List[tuple] = []
+        self.secuencia = count()
+
+    def sumar(self, creador, puntos) -> None:
+        clave = self.claves.get(creador)
+        if clave is not None:
+            self.quitar(clave)
+        total = self.puntos.get(creador, 0) + puntos
+        clave = (-total, next(self.secuencia), creador)
+        self.puntos[creador] = total
+        self.claves[creador] = clave
+        self.insertar(clave)
+
+    def insertar(self, clave) -> None:
+        if not self.bloques:
+            self.bloques.append([clave])
+            self.maximos.append(clave)
+            return
+        i = min(bisect_left(self.maximos, clave), len(self.bloques) - 1)
+        bloque = self.bloques[i]
+        insort(bloque, clave)
+        if len(bloque) > 2 * self.tamano_bloque:
+            self.bloques[i:i + 1] = [bloque[:self.tamano_bloque], bloque[self.tamano_bloque:]]
+            self.maximos[i:i + 1] = [bloque[self.tamano_bloque - 1], bloque[-1]]
+        else:
+            self.maximos[i] = bloque[-1]
+
+    def quitar(self, clave) -> None:
+        i = bisect_left(self.maximos, clave)
+        bloque = self.bloques[i]
+        del bloque[bisect_left(bloque, clave)]
+        if bloque:
+            self.maximos[i] = bloque[-1]
+        else:
+            del self.bloques[i]
+            del self.maximos[i]
+
+    def top(self, n) -> List[tuple]:
+        resultado = []
+        for bloque in self.bloques:
+            for puntos, _, creador in bloque[:n - len(resultado)]:
+                resultado.append((creador, -puntos))
+            if len(resultado) >= n:
+                break
+        return resultado
+
+    def posicion(self, creador) -> int | None:
+        clave = self.claves.get(creador)
+        if clave is None:
+            return None
+        i = bisect_left(self.maximos, clave)
+        return sum(len(bloque) for bloque in self.bloques[:i]) + bisect_left(self.bloques[i], clave) + 1
+
+class IndiceGanancias:
+    # Ranking de creadores alimentado por Creador.sumarPuntos, global y por mes.
+    # Escrituras y lecturas toman self.lock: la consolidacion del registro de
+    # compras puede sumar puntos desde otro hilo mientras se consulta.
+
+    def __init__(self):
+        self.clasificacion_global: Clasificacion = Clasificacion()
+        self.mensual: Dict[tuple, Clasificacion] = {}
+        self.lock: threading.Lock = threading.Lock()
+
+    def registrarCreador(self, creador) -> Creador:
+        creador.indice_ganancias = self
+        return creador
+
+    def registrarPuntos(self, creador, puntos, fecha = None) -> None:
+        fecha = fecha or date.today()
+        with self.lock:
+            self.clasificacion_global.sumar(creador, puntos)
+            periodo = (fecha.year, fecha.month)
+            if periodo not in self.mensual:
+                self.mensual[periodo] = Clasificacion()
+            self.mensual[periodo].sumar(creador, puntos)
+
+    def topCreadores(self, n, anio = None, mes = None) -> List[tuple]:
+        with self.lock:
+            if anio is None:
+                return self.clasificacion_global.top(n)
+            clasificacion = self.mensual.get((anio, mes))
+            return clasificacion.top(n) if clasificacion else []
+
+    def topCreadoresEntre(self, n, desde, hasta) -> List[tuple]:
+        # Ventana de varios meses: solo recorre los creadores activos en ella.
+        totales = defaultdict(float)
+        with self.lock:
+            for (anio, mes), clasificacion in self.mensual.items():
+                if (desde.year, desde.month) <= (anio, mes) <= (hasta.year, hasta.month):
+                    for creador, puntos in clasificacion.puntos.items():
+                        totales[creador] += puntos
+        return heapq.nlargest(n, totales.items(), key=lambda item: item[1])
+
+    def posicionCreador(self, creador) -> int | None:
+        with self.lock:
+            return self.clasificacion_global.posicion(creador)
+
+    @staticmethod
+    def recursosMasRentables(creador, n) -> List[Recurso]:
+        return heapq.nlargest(n, creador.recursos_creados, key=lambda recurso: recurso.ingresos)
+
+
+class AlmacenRecursos:
+    # Catalogo columnar: cada atributo de los recursos es una columna (arrays
+    # compactos para los numericos, listas para los textos) y las estrategias y
+    # creadores se guardan internados por id. Los Recurso se obtienen como
+    # vistas bajo demanda con recurso(indice); cada indice tiene una unica
+    # vista, de modo que sirve como clave (MotorLiberacion, compras). Los
+    # creadores no enlazan sus filas en recursos_creados: se consultan con
+    # recursosCreados y recursosMasRentables del almacen.
+
+    def __init__(self, estrategias, creadores):
+        self.estrategias: List[Estrategia] = []
+        self.ids_estrategia: Dict[str, int] = {}
+        for nombre, estrategia in estrategias.items():
+            self.registrarEstrategia(nombre, estrategia)
+        self.creadores: List[Creador] = list(creadores)
+        self.ids_creador: Dict[str, int] = {creador.email: i for i, creador in enumerate(self.creadores)}
+        self.descripciones: List[str] = []
+        self.imagenes: List[str] = []
+        self.urls: List[str] = []
+        self.creador_ids: array = array('l')
+        self.estrategia_ids: array = array('l')
+        self.fechas_carga: array = array('l')
+        self.precios_base: array = array('d')
+        self.num_compras: array = array('q')
+        self.ingresos: array = array('d')
+        self.vistas: Dict[int, VistaRecurso] = {}
+        self.lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.precios_base)
+
+    def registrarEstrategia(self, nombre, estrategia) -> int:
+        if nombre not in self.ids_estrategia:
+            self.ids_estrategia[nombre] = len(self.estrategias)
+            self.estrategias.append(estrategia)
+        return self.ids_estrategia[nombre]
+
+    def idEstrategia(self, estrategia) -> int:
+        for i, registrada in enumerate(self.estrategias):
+            if registrada is estrategia:
+                return i
+        return self.registrarEstrategia(f"estrategia-{len(self.estrategias)}", estrategia)
+
+    def cargarFilas(self, filas) -> int:
+        # Cada fila es un dict con creador (email), descripcion, imagen, url,
+        # fecha_carga (ISO), precio_base y estrategia (nombre registrado).
+        # Todas las filas se validan en columnas temporales antes de tocar
+        # el almacen: una fila erronea no deja columnas desalineadas.
+        creador_ids, estrategia_ids = array('l'), array('l')
+        fechas_carga, precios_base = array('l'), array('d')
+        descripciones, imagenes, urls = [], [], []
+        ordinales: Dict[str, int] = {}
+        for numero, fila in enumerate(filas, 1):
+            try:
+                id_creador = self.ids_creador[fila["creador"]]
+                id_estrategia = self.ids_estrategia[fila["estrategia"]]
+                fecha = fila["fecha_carga"]
+                if fecha not in ordinales:
+                    ordinales[fecha] = date.fromisoformat(fecha).toordinal()
+                precio_base = float(fila["precio_base"])
+                textos = (fila["descripcion"], fila["imagen"], fila["url"])
+            except KeyError as error:
+                raise ValueError(f"Fila {numero}: creador, estrategia o campo desconocido: {error}") from None
+            except (TypeError, ValueError) as error:
+                raise ValueError(f"Fila {numero}: valor no valido: {error}") from None
+            creador_ids.append(id_creador)
+            estrategia_ids.append(id_estrategia)
+            fechas_carga.append(ordinales[fecha])
+            precios_base.append(precio_base)
+            descripciones.append(textos[0])
+            imagenes.append(textos[1])
+            urls.append(textos[2])
+        agregadas = len(precios_base)
+        with self.lock:
+            self.creador_ids.extend(creador_ids)
+            self.estrategia_ids.extend(estrategia_ids)
+            self.fechas_carga.extend(fechas_carga)
+            self.descripciones.extend(descripciones)
+            self.imagenes.extend(imagenes)
+            self.urls.extend(urls)
+            self.num_compras.extend(array('q', [0]) * agregadas)
+            self.ingresos.extend(array('d', [0.0]) * agregadas)
+            self.precios_base.extend(precios_base)
+        return agregadas
+
+    def cargarCSV(self, ruta) -> int:
+        with open(ruta, newline="", encoding="utf-8") as fichero:
+            return self.cargarFilas(csv.DictReader(fichero))
+
+    def cargarJSONL(self, ruta) -> int:
+        with open(ruta, encoding="utf-8") as fichero:
+            return self.cargarFilas(json.loads(linea) for linea in fichero if linea.strip())
+
+    def recurso(self, indice) -> VistaRecurso:
+        if not 0 <= indice < len(self):
+            raise IndexError(f"No existe el recurso {indice}")
+        vista = self.vistas.get(indice)
+        if vista is None:
+            vista = self.vistas.setdefault(indice, VistaRecurso(self, indice))
+        return vista
+
+    def recursosCreados(self, creador) -> List[VistaRecurso]:
+        id_creador = self.ids_creador.get(creador.email)
+        return [self.recurso(i) for i, actual in enumerate(self.creador_ids) if actual == id_creador]
+
+    def recursosMasRentables(self, creador, n) -> List[VistaRecurso]:
+        id_creador = self.ids_creador.get(creador.email)
+        indices = (i for i, actual in enumerate(self.creador_ids) if actual == id_creador)
+        return [self.recurso(i) for i in heapq.nlargest(n, indices, key=self.ingresos.__getitem__)]
+
+    def preciosYPuntos(self) -> tuple:
+        # Todas las estrategias son lineales en precio_base, asi que basta con
+        # evaluar cada estrategia una vez (con precio 1) y escalar la columna.
+        factores = [estrategia.calcularPrecioYPuntos(1.0) for estrategia in self.estrategias]
+        factores_precio = [factor[0] for factor in factores]
+        factores_puntos = [factor[1] for factor in factores]
+        precios = array('d', map(mul, self.precios_base, map(factores_precio.__getitem__, self.estrategia_ids)))
+        puntos = array('d', map(mul, self.precios_base, map(factores_puntos.__getitem__, self.estrategia_ids)))
+        return precios, puntos
+
+class VistaRecurso(Recurso):
+    # Recurso ligero que lee y escribe directamente en las columnas del almacen.
+
+    def __init__(self, almacen, indice):
+        self.almacen: AlmacenRecursos = almacen
+        self.indice: int = indice
+        self.lock: threading.Lock = almacen.lock
+        self.cache_precio: tuple = None
+
+    @property
+    def creador(self) -> Creador:
+        return self.almacen.creadores[self.almacen.creador_ids[self.indice]]
+
+    @property
+    def descripcion(self) -> str:
+        return self.almacen.descripciones[self.indice]
+
+    @property
+    def imagen(self) -> str:
+        return self.almacen.imagenes[self.indice]
+
+    @property
+    def url(self) -> str:
+        return self.almacen.urls[self.indice]
+
+    @property
+    def fecha_carga(self) -> date:
+        return date.fromordinal(self.almacen.fechas_carga[self.indice])
+
+    @property
+    def precio_base(self) -> float:
+        return self.almacen.precios_base[self.indice]
+
+    @precio_base.setter
+    def precio_base(self, precio_base) -> None:
+        self.almacen.precios_base[self.indice] = precio_base
+
+    @property
+    def estrategia(self) -> Estrategia:
+        return self.almacen.estrategias[self.almacen.estrategia_ids[self.indice]]
+
+    @estrategia.setter
+    def estrategia(self, estrategia) -> None:
+        self.almacen.estrategia_ids[self.indice] = self.almacen.idEstrategia(estrategia)
+
+    @property
+    def num_compras(self) -> int:
+        return self.almacen.num_compras[self.indice]
+
+    @num_compras.setter
+    def num_compras(self, num_compras) -> None:
+        self.almacen.num_compras[self.indice] = num_compras
+
+    @property
+    def ingresos(self) -> float:
+        return self.almacen.ingresos[self.indice]
+
+    @ingresos.setter
+    def ingresos(self, ingresos) -> None:
+        self.almacen.ingresos[self.indice] = ingresos
+
+
+
+if __name__ == "__main__":
+    # Crear usuarios
+    usuario1 = Usuario("Juan Perez", "juan@example.com", "1234")
+    usuario2 = Usuario("Maria Gomez", "maria@example.com", "5678")
+    usuario3 = Usuario("Carlos Ruiz", "carlos@example.com", "abcd1234")
+    creador1 = Creador("Ana Lopez", "ana@example.com", "abcd")
+
+    # Crear estrategias
+    estrategia_normal = EstrategiaNormal()
+    estrategia_oferta = EstrategiaOferta(date.today() + timedelta(days=5), 20)  # 20% de descuento hasta dentro de 5 días
+    estrategia_crowd = EstrategiaCrowdBased(3)  # Se necesitan al menos 3 compradores
+
+    # Crear recursos con diferentes estrategias
+    recurso1 = Recurso(creador1, "Recurso Normal", "imagen1.png", "http://recurso1.com", date.today(), 100, estrategia_normal)
+    recurso2 = Recurso(creador1, "Recurso en Oferta", "imagen2.png", "http://recurso2.com", date.today(), 200, estrategia_oferta)
+    recurso3 = Recurso(creador1, "Recurso Crowd-Based", "imagen3.png", "http://recurso3.com", date.today(), 300, estrategia_crowd)
+
+    # Agregar recursos creados al creador
+    creador1.agregarRecursoCreado(recurso1)
+    creador1.agregarRecursoCreado(recurso2)
+    creador1.agregarRecursoCreado(recurso3)
+
+    # Simular compras
+    print("Compra de recurso normal:")
+    comprarRecurso(usuario1, recurso1)
+
+    print("\nCompra de recurso en oferta:")
+    comprarRecurso(usuario1, recurso2)
+
+    print("\nCompra de recurso Crowd-Based:")
+    comprarRecurso(usuario1, recurso3)
+
+    # Segunda compra para el recurso Crowd-Based
+    print("\nSegunda compra del recurso Crowd-Based:")
+    comprarRecurso(usuario2, recurso3)
+
+    # Tercera compra para liberar el recurso Crowd-Based
+    print("\nTercera compra del recurso Crowd-Based:")
+    comprarRecurso(usuario3, recurso3)
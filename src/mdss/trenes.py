@@ -0,0 +1,713 @@
+﻿from __future__ import annotations
+from abc import ABC, abstractmethod
+from datetime import timedelta, date
+import datetime
+from typing import List, Dict, Set
+from bisect import bisect_left, bisect_right
+from itertools import count, accumulate, islice
+from operator import le
+from array import array
+from math import ceil
+from concurrent.futures import ProcessPoolExecutor
+import calendar
+import heapq
+
+class Tren:
+
+    def __init__(self, numero_serie, modelo, marca, fecha_incorporacion, kilometraje_inicial):
+        self.numero_serie: str = numero_serie
+        self.modelo: Modelo = modelo
+        self.marca: str = marca
+        self.fecha_incorporacion: date = fecha_incorporacion
+        self.kilometraje_inicial: float = kilometraje_inicial
+        self.kilometraje_total: float = kilometraje_inicial
+        self.viajes: List[Viaje] = []
+        self.tareas_realizadas: List[TareaRealizada] = []
+        self.historial: HistorialMantenimiento = HistorialMantenimiento()
+        self.fecha_ultimo_viaje: date = None
+        self.ultima_realizacion: Dict[Tarea, tuple] = {}
+        self.planificador: PlanificadorMantenimiento = None
+        self.telemetria: TelemetriaViajes = TelemetriaViajes()
+
+    def registrarViaje(self, viaje) -> None:
+        self.viajes.append(viaje)
+        self.telemetria.agregar([segundosDesdeEpoca(viaje.fecha_hora)], [viaje.km_recorridos])
+        self.actualizarKilometraje(viaje.km_recorridos)
+        self.viajesRegistrados()
+
+    def registrarViajes(self, instantes, kms) -> float:
+        # Ingesta en bloque desde telemetria: instantes en segundos desde
+        # 1970-01-01 y km de cada viaje. No crea objetos Viaje.
+        km = self.telemetria.agregar(instantes, kms)
+        self.actualizarKilometraje(km)
+        self.viajesRegistrados()
+        return km
+
+    def viajesRegistrados(self) -> None:
+        fecha = self.telemetria.ultimaFecha()
+        if fecha is not None and (self.fecha_ultimo_viaje is None or fecha > self.fecha_ultimo_viaje):
+            self.fecha_ultimo_viaje = fecha
+        if self.planificador is not None:
+            self.planificador.viajeRegistrado(self)
+
+    def registrarTareaRealizada(self, tarea_realiazda) -> None:
+        self.tareas_realizadas.append(tarea_realiazda)
+        self.historial.registrar(tarea_realiazda)
+        ultima = self.ultima_realizacion.get(tarea_realiazda.tarea)
+        if ultima is None or tarea_realiazda.fecha >= ultima[0]:
+            self.ultima_realizacion[tarea_realiazda.tarea] = (tarea_realiazda.fecha, self.kilometraje_total)
+        if self.planificador is not None:
+            self.planificador.tareaRegistrada(self, tarea_realiazda.tarea)
+
+    def actualizarKilometraje(self, km) -> None:
+        self.kilometraje_total += km
+
+    def kmDiarios(self) -> float:
+        if self.fecha_ultimo_viaje is None:
+            return 0.0
+        dias = max((self.fecha_ultimo_viaje - self.fecha_incorporacion).days, 1)
+        return (self.kilometraje_total - self.kilometraje_inicial) / dias
+
+class Modelo:
+    # plan_mantenimiento es una propiedad: al cambiarlo se avisa a los
+    # planificadores con trenes del modelo.
+
+    def __init__(self, nombre, plan_mantenimiento):
+        self.nombre: str = nombre
+        self.planificadores: List[PlanificadorMantenimiento] = []
+        self._plan_mantenimiento: PlanMantenimiento = plan_mantenimiento
+
+    @property
+    def plan_mantenimiento(self) -> PlanMantenimiento:
+        return self._plan_mantenimiento
+
+    @plan_mantenimiento.setter
+    def plan_mantenimiento(self, plan_mantenimiento) -> None:
+        anterior = self._plan_mantenimiento
+        self._plan_mantenimiento = plan_mantenimiento
+        if plan_mantenimiento is not anterior:
+            for planificador in self.planificadores:
+                planificador.planCambiado(self, anterior)
+
+    def asignarPlanMantenimiento(self, plan_mantenimiento) -> PlanMantenimiento:
+        self.plan_mantenimiento = plan_mantenimiento
+        return plan_mantenimiento
+
+class Viaje:
+
+    def __init__(self, fecha_hora, km_recorridos):
+         self.fecha_hora: datetime = fecha_hora
+         self.km_recorridos: float = km_recorridos
+
+EPOCA = datetime.datetime(1970, 1, 1)
+
+def segundosDesdeEpoca(fecha_hora) -> float:
+    return (fecha_hora - EPOCA).total_seconds()
+
+class TelemetriaViajes:
+    # Viajes de un tren en columnas: instantes ordenados y km de cada viaje,
+    # mas la suma acumulada de km, de modo que los km de cualquier intervalo
+    # salen de dos busquedas binarias sin materializar objetos Viaje.
+
+    def __init__(self):
+        self.instantes: array = array('d')
+        self.kms: array = array('d')
+        self.acumulado: array = array('d', [0.0])
+
+    def __len__(self) -> int:
+        return len(self.instantes)
+
+    def agregar(self, instantes, kms) -> float:
+        instantes = array('d', instantes)
+        kms = array('d', kms)
+        if len(instantes) != len(kms):
+            raise ValueError("Se necesita un valor de km por cada instante.")
+        if not instantes:
+            return 0.0
+        if not all(map(le, instantes, islice(instantes, 1, None))):
+            pares = sorted(zip(instantes, kms))
+            instantes = array('d', (instante for instante, _ in pares))
+            kms = array('d', (km for _, km in pares))
+        if self.instantes and instantes[0] < self.instantes[-1]:
+            pares = sorted(zip(self.instantes + instantes, self.kms + kms))
+            self.instantes = array('d', (instante for instante, _ in pares))
+            self.kms = array('d', (km for _, km in pares))
+            self.acumulado = array('d', accumulate(self.kms, initial=0.0))
+        else:
+            self.instantes.extend(instantes)
+            self.kms.extend(kms)
+            self.acumulado.extend(islice(accumulate(kms, initial=self.acumulado[-1]), 1, None))
+        return sum(kms)
+
+    def ultimaFecha(self) -> date | None:
+        if not self.instantes:
+            return None
+        return (EPOCA + timedelta(seconds=self.instantes[-1])).date()
+
+    def kmEntre(self, desde, hasta) -> float:
+        # Intervalo [desde, hasta) de datetimes.
+        inicio = bisect_left(self.instantes, segundosDesdeEpoca(desde))
+        fin = bisect_left(self.instantes, segundosDesdeEpoca(hasta))
+        return self.acumulado[fin] - self.acumulado[inicio]
+
+    def kmPorPeriodo(self, desde, hasta, periodo) -> List[tuple]:
+        resultado = []
+        inicio = desde
+        while inicio < hasta:
+            fin = min(inicio + periodo, hasta)
+            resultado.append((inicio, self.kmEntre(inicio, fin)))
+            inicio = fin
+        return resultado
+
+    def kmPorDia(self, desde, hasta) -> List[tuple]:
+        desde = datetime.datetime.combine(desde, datetime.time.min)
+        hasta = datetime.datetime.combine(hasta, datetime.time.min)
+        return [(inicio.date(), km) for inicio, km in self.kmPorPeriodo(desde, hasta, timedelta(days=1))]
+
+    def kmPorSemana(self, desde, hasta) -> List[tuple]:
+        desde = datetime.datetime.combine(desde, datetime.time.min)
+        hasta = datetime.datetime.combine(hasta, datetime.time.min)
+        return [(inicio.date(), km) for inicio, km in self.kmPorPeriodo(desde, hasta, timedelta(weeks=1))]
+
+class Repuesto:
+    # precio es una propiedad: asignarlo invalida el coste de las tareas que
+    # usan el repuesto (y, en cadena, el de sus planes e historiales).
+
+    def __init__(self, nombre, precio):
+        self.nombre: str = nombre
+        self.tareas: List[Tarea] = []
+        self._precio: float = precio
+
+    @property
+    def precio(self) -> float:
+        return self._precio
+
+    @precio.setter
+    def precio(self, precio) -> None:
+        self._precio = precio
+        for tarea in self.tareas:
+            tarea.invalidarCoste()
+
+    def cambiarPrecio(self, precio) -> None:
+        self.precio = precio
+
+class Tarea(ABC):
+    # precio_base y repuestos son propiedades: asignarlas invalida el coste en
+    # cache. La lista de repuestos se modifica con agregarRepuesto y
+    # quitarRepuesto (o asignando una lista nueva), no mutandola en el lugar.
+    
+    def __init__(self, id, tiempo_estimado, precio_base, repuestos):
+        self.id: str = id
+        self.tiempo_estimado: timedelta = tiempo_estimado
+        self.planes: List[PlanMantenimiento] = []
+        self.historiales: Set[HistorialMantenimiento] = set()
+        self.coste_base_cache: float = None
+        self._precio_base: float = precio_base
+        self._repuestos: List[Repuesto] = []
+        self.repuestos = repuestos
+
+    @property
+    def precio_base(self) -> float:
+        return self._precio_base
+
+    @precio_base.setter
+    def precio_base(self, precio_base) -> None:
+        self._precio_base = precio_base
+        self.invalidarCoste()
+
+    @property
+    def repuestos(self) -> List[Repuesto]:
+        return self._repuestos
+
+    @repuestos.setter
+    def repuestos(self, repuestos) -> None:
+        for repuesto in self._repuestos:
+            repuesto.tareas.remove(self)
+        self._repuestos = repuestos
+        for repuesto in repuestos:
+            repuesto.tareas.append(self)
+        self.invalidarCoste()
+
+    def costeBase(self) -> float:
+        if self.coste_base_cache is None:
+            self.coste_base_cache = self.precio_base + sum(repuesto.precio for repuesto in self.repuestos)
+        return self.coste_base_cache
+
+    def cambiarPrecioBase(self, precio_base) -> None:
+        self.precio_base = precio_base
+
+    def agregarRepuesto(self, repuesto) -> None:
+        self.repuestos.append(repuesto)
+        repuesto.tareas.append(self)
+        self.invalidarCoste()
+
+    def quitarRepuesto(self, repuesto) -> None:
+        if repuesto in self.repuestos:
+            self.repuestos.remove(repuesto)
+            repuesto.tareas.remove(self)
+            self.invalidarCoste()
+
+    def invalidarCoste(self) -> None:
+        self.coste_base_cache = None
+        for plan in self.planes:
+            plan.invalidarCoste()
+        for historial in self.historiales:
+            historial.invalidarCoste()
+
+    def coeficientesCoste(self) -> tuple:
+        # calcularCosteFinal(km) == fijo + por_km * km
+        return self.costeBase(), 0.0
+
+    @abstractmethod
+    def calcularCosteFinal(self, km_recorridos = None):
+        pass
+
+    @abstractmethod
+    def proximaFecha(self, tren) -> date:
+        pass
+
+class TareaPeriodica(Tarea):
+
+    def __init__(self, id, tiempo_estimado, precio_base, repuestos, periodicidad_tiempo):
+        if periodicidad_tiempo <= timedelta(0):
+            raise ValueError("La periodicidad de la tarea debe ser positiva.")
+        super().__init__(id, tiempo_estimado, precio_base, repuestos)
+        self.periodicidad_tiempo: timedelta = periodicidad_tiempo
+
+    def calcularCosteFinal(self, km_recorridos = None):
+        return self.costeBase()
+
+    def proximaFecha(self, tren) -> date:
+        ultima = tren.ultima_realizacion.get(self)
+        desde = ultima[0] if ultima else tren.fecha_incorporacion
+        return desde + self.periodicidad_tiempo
+
+class TareaPorRodadura(Tarea):
+
+    coste_por_km: float = 0.05
+
+    def __init__(self, id, tiempo_estimado, precio_base, repuestos, periodicidad_km):
+        if periodicidad_km <= 0:
+            raise ValueError("La periodicidad en km de la tarea debe ser positiva.")
+        super().__init__(id, tiempo_estimado, precio_base, repuestos)
+        self.periodicidad_km: float = periodicidad_km
+
+    def coeficientesCoste(self) -> tuple:
+        return self.costeBase(), self.coste_por_km
+
+    def calcularCosteFinal(self, km_recorridos) -> float:
+        return self.costeBase() + (self.coste_por_km * km_recorridos)
+
+    def proximaFecha(self, tren) -> date:
+        # Se estima con el ritmo medio de km diarios del tren.
+        ultima = tren.ultima_realizacion.get(self)
+        km_desde = ultima[1] if ultima else tren.kilometraje_inicial
+        km_restantes = km_desde + self.periodicidad_km - tren.kilometraje_total
+        if km_restantes <= 0:
+            return tren.fecha_ultimo_viaje or date.today()
+        km_diarios = tren.kmDiarios()
+        if km_diarios <= 0:
+            return date.max
+        referencia = tren.fecha_ultimo_viaje or date.today()
+        dias = ceil(km_restantes / km_diarios)
+        if dias >= (date.max - referencia).days:
+            return date.max
+        return referencia + timedelta(days=dias)
+
+class TareaRealizada():
+
+    def __init__(self, tarea, fecha, descripcion):
+        self.tarea: Tarea = tarea
+        self.fecha: date = fecha
+        self.descripcion: str = descripcion
+
+class HistorialMantenimiento():
+    # Tareas realizadas de un tren ordenadas por fecha, con sumas acumuladas
+    # de la parte fija del coste y del coeficiente por km. El coste de
+    # cualquier rango de fechas sale de dos busquedas binarias: O(log n).
+    # Los costes son los vigentes al consultar: si cambia el coste de una
+    # tarea del historial, las sumas se rehacen en la siguiente consulta.
+
+    def __init__(self):
+        self.fechas: List[int] = []
+        self.tareas: List[TareaRealizada] = []
+        self.acumulado_fijo: List[float] = [0.0]
+        self.acumulado_por_km: List[float] = [0.0]
+        self.invalido_desde: int = None
+
+    def registrar(self, tarea_realizada) -> None:
+        fecha = tarea_realizada.fecha.toordinal()
+        posicion = bisect_right(self.fechas, fecha)
+        self.fechas.insert(posicion, fecha)
+        self.tareas.insert(posicion, tarea_realizada)
+        tarea_realizada.tarea.historiales.add(self)
+        if self.invalido_desde is not None:
+            self.invalido_desde = min(self.invalido_desde, posicion)
+        elif posicion == len(self.fechas) - 1:
+            fijo, por_km = tarea_realizada.tarea.coeficientesCoste()
+            self.acumulado_fijo.append(self.acumulado_fijo[-1] + fijo)
+            self.acumulado_por_km.append(self.acumulado_por_km[-1] + por_km)
+        else:
+            self.recalcularDesde(posicion)
+
+    def recalcularDesde(self, posicion) -> None:
+        del self.acumulado_fijo[posicion + 1:]
+        del self.acumulado_por_km[posicion + 1:]
+        for tarea_realizada in self.tareas[posicion:]:
+            fijo, por_km = tarea_realizada.tarea.coeficientesCoste()
+            self.acumulado_fijo.append(self.acumulado_fijo[-1] + fijo)
+            self.acumulado_por_km.append(self.acumulado_por_km[-1] + por_km)
+
+    def invalidarCoste(self) -> None:
+        self.invalido_desde = 0
+
+    def actualizar(self) -> None:
+        if self.invalido_desde is not None:
+            posicion, self.invalido_desde = self.invalido_desde, None
+            self.recalcularDesde(posicion)
+
+    def rango(self, desde, hasta) -> tuple:
+        return bisect_left(self.fechas, desde.toordinal()), bisect_right(self.fechas, hasta.toordinal())
+
+    def costeEntre(self, desde, hasta, km_recorridos) -> float:
+        self.actualizar()
+        inicio, fin = self.rango(desde, hasta)
+        fijo = self.acumulado_fijo[fin] - self.acumulado_fijo[inicio]
+        por_km = self.acumulado_por_km[fin] - self.acumulado_por_km[inicio]
+        return fijo + por_km * km_recorridos
+
+    def costeMes(self, anio, mes, km_recorridos) -> float:
+        return self.costeEntre(*limitesMes(anio, mes), km_recorridos)
+
+    def tareasEntre(self, desde, hasta) -> List[TareaRealizada]:
+        inicio, fin = self.rango(desde, hasta)
+        return self.tareas[inicio:fin]
+
+def limitesMes(anio, mes) -> tuple:
+    return date(anio, mes, 1), date(anio, mes, calendar.monthrange(anio, mes)[1])
+
+class PlanMantenimiento():
+
+    def __init__(self, version):
+        self.version: str = version
+        self.modelos_aplicables: List[Modelo] = []
+        self.tareas: List[Tarea] = []
+        self.coste_total_cache: float = None
+        self.planificadores: List[PlanificadorMantenimiento] = []
+
+    def agregarModelo(self, modelo):
+        self.modelos_aplicables.append(modelo)
+
+    def agregarTarea(self, tarea):
+        self.tareas.append(tarea)
+        tarea.planes.append(self)
+        self.invalidarCoste()
+        for planificador in self.planificadores:
+            planificador.tareaAgregada(self, tarea)
+
+    def quitarTarea(self, tarea):
+        if tarea in self.tareas:
+            self.tareas.remove(tarea)
+            tarea.planes.remove(self)
+            self.invalidarCoste()
+            for planificador in self.planificadores:
+                planificador.tareaQuitada(self, tarea)
+
+    def costeTotal(self) -> float:
+        if self.coste_total_cache is None:
+            self.coste_total_cache = sum(tarea.costeBase() for tarea in self.tareas)
+        return self.coste_total_cache
+
+    def invalidarCoste(self) -> None:
+        self.coste_total_cache = None
+
+class PlanificadorMantenimiento():
+    # Cola de prioridad con el proximo vencimiento de cada (tren, tarea) del
+    # plan de su modelo. Al registrar un viaje solo se reprograman las tareas
+    # por rodadura de ese tren, y al registrar una tarea solo esa tarea; las
+    # entradas antiguas quedan obsoletas en el heap y se descartan al salir.
+    # Los planes avisan al planificador cuando se agregan o quitan tareas, y
+    # los modelos cuando cambian de plan.
+
+    def __init__(self):
+        self.eventos: List[tuple] = []
+        self.vigentes: Dict[tuple, int] = {}
+        self.trenes_por_modelo: Dict[Modelo, List[Tren]] = {}
+        self.secuencia = count()
+
+    def programarTren(self, tren) -> None:
+        tren.planificador = self
+        modelo = tren.modelo
+        if modelo is None:
+            return
+        if modelo not in self.trenes_por_modelo:
+            modelo.planificadores.append(self)
+        self.trenes_por_modelo.setdefault(modelo, []).append(tren)
+        plan = modelo.plan_mantenimiento
+        if plan is None:
+            return
+        self.vincularPlan(plan)
+        for tarea in plan.tareas:
+            self.programar(tren, tarea)
+
+    def vincularPlan(self, plan) -> None:
+        if self not in plan.planificadores:
+            plan.planificadores.append(self)
+
+    def trenesDelPlan(self, plan) -> List[Tren]:
+        # Solo los trenes cuyo modelo usa hoy el plan.
+        return [
+            tren
+            for modelo, trenes in self.trenes_por_modelo.items() if modelo.plan_mantenimiento is plan
+            for tren in trenes
+        ]
+
+    def planCambiado(self, modelo, anterior) -> None:
+        # Las entradas del plan anterior dejan de estar vigentes (se descartan
+        # al salir del heap) y se programan las tareas del plan nuevo.
+        plan = modelo.plan_mantenimiento
+        if plan is not None:
+            self.vincularPlan(plan)
+        for tren in self.trenes_por_modelo.get(modelo, ()):
+            if anterior is not None:
+                for tarea in anterior.tareas:
+                    self.vigentes.pop((tren, tarea), None)
+            if plan is not None:
+                for tarea in plan.tareas:
+                    self.programar(tren, tarea)
+
+    def tareaAgregada(self, plan, tarea) -> None:
+        for tren in self.trenesDelPlan(plan):
+            self.programar(tren, tarea)
+
+    def tareaQuitada(self, plan, tarea) -> None:
+        for tren in self.trenesDelPlan(plan):
+            self.vigentes.pop((tren, tarea), None)
+
+    def programar(self, tren, tarea) -> None:
+        fecha = tarea.proximaFecha(tren)
+        secuencia = next(self.secuencia)
+        self.vigentes[(tren, tarea)] = secuencia
+        heapq.heappush(self.eventos, (fecha, secuencia, tren, tarea))
+        if len(self.eventos) > 2 * len(self.vigentes) + 64:
+            self.compactar()
+
+    def compactar(self) -> None:
+        self.eventos = [evento for evento in self.eventos if self.vigentes.get((evento[2], evento[3])) == evento[1]]
+        heapq.heapify(self.eventos)
+
+    def viajeRegistrado(self, tren) -> None:
+        plan = tren.modelo.plan_mantenimiento if tren.modelo else None
+        if plan is None:
+            return
+        for tarea in plan.tareas:
+            if isinstance(tarea, TareaPorRodadura):
+                self.programar(tren, tarea)
+
+    def tareaRegistrada(self, tren, tarea) -> None:
+        if (tren, tarea) in self.vigentes:
+            self.programar(tren, tarea)
+
+    def proximos(self, hasta) -> List[tuple]:
+        # (fecha, tren, tarea) con vencimiento hasta la fecha dada, en orden.
+        # Cuesta O(k log n) para k resultados, sin recorrer toda la flota.
+        vencidos = []
+        while self.eventos and self.eventos[0][0] <= hasta:
+            evento = heapq.heappop(self.eventos)
+            if self.vigentes.get((evento[2], evento[3])) == evento[1]:
+                vencidos.append(evento)
+        for evento in vencidos:
+            heapq.heappush(self.eventos, evento)
+        return [(fecha, tren, tarea) for fecha, _, tren, tarea in vencidos]
+
+    def vencidasHoy(self) -> List[tuple]:
+        return self.proximos(date.today())
+
+class SistemaMantenimiento():
+
+    def __init__(self):
+        self.trenes: List[Tren] = []
+        self.planes_mantenimiento: List[PlanMantenimiento] = []
+        self.planificador: PlanificadorMantenimiento = PlanificadorMantenimiento()
+
+    def registrarTren(self, tren) -> Tren:
+        self.trenes.append(tren)
+        self.planificador.programarTren(tren)
+        return tren
+
+    def registrarPlanMantenimiento(self, plan) -> PlanMantenimiento:
+        self.planes_mantenimiento.append(plan)
+        return plan
+
+    def obtenerCostoTareasPorMes(self, tren, anio, mes) -> float:
+        return tren.historial.costeMes(anio, mes, tren.kilometraje_total)
+
+    def obtenerCostoTareasEntre(self, tren, desde, hasta) -> float:
+        return tren.historial.costeEntre(desde, hasta, tren.kilometraje_total)
+
+    def obtenerCostesFlotaPorMes(self) -> tuple:
+        # Matriz tren x mes en una sola pasada por el historial de cada tren.
+        # Devuelve los meses (anio, mes) ordenados y, por numero de serie, la
+        # fila de costes alineada con ellos.
+        costes: Dict[str, Dict[tuple, float]] = {}
+        meses = set()
+        for tren in self.trenes:
+            fila = costes.setdefault(tren.numero_serie, {})
+            for tarea_realizada in tren.historial.tareas:
+                mes = (tarea_realizada.fecha.year, tarea_realizada.fecha.month)
+                fijo, por_km = tarea_realizada.tarea.coeficientesCoste()
+                fila[mes] = fila.get(mes, 0.0) + fijo + por_km * tren.kilometraje_total
+                meses.add(mes)
+        meses = sorted(meses)
+        return meses, {serie: [fila.get(mes, 0.0) for mes in meses] for serie, fila in costes.items()}
+
+    def obtenerPlanesMantenimientoMasCostosos(self, n = 5) -> List[PlanMantenimiento]:
+        planes_ordenados = heapq.nlargest(n, self.planes_mantenimiento, key=PlanMantenimiento.costeTotal)
+        
+        print("Planes de mantenimiento más costosos:")
+        for plan in planes_ordenados:
+            print(f"Versión: {plan.version}, Costo Total: {plan.costeTotal()}")
+        return planes_ordenados
+
+class EscenarioUso():
+
+    def __init__(self, nombre, factor_km = 1.0):
+        self.nombre: str = nombre
+        self.factor_km: float = factor_km
+
+def simularEscenario(filas, factor_km, horizonte_dias) -> Dict[str, list]:
+    # Ocurrencias y coste por tren en el horizonte, en forma cerrada: las
+    # periodicas caen cada periodicidad_tiempo y las de rodadura cada
+    # periodicidad_km, con coste fijo + por_km * km del tren en ese momento.
+    resultado: Dict[str, list] = {}
+    for fila in filas:
+        if fila[0] == "P":
+            _, serie, fijo, dias_hasta_primera, periodo_dias = fila
+            primera = max(dias_hasta_primera, 0)
+            ocurrencias = 0 if primera > horizonte_dias else 1 + int((horizonte_dias - primera) // periodo_dias)
+            coste = ocurrencias * fijo
+        else:
+            _, serie, fijo, por_km, km_total, km_restantes, periodicidad_km, km_diarios = fila
+            km_horizonte = km_diarios * factor_km * horizonte_dias
+            restantes = max(km_restantes, 0)
+            ocurrencias = 0 if km_horizonte < restantes else 1 + int((km_horizonte - restantes) // periodicidad_km)
+            km_primera = km_total + restantes
+            coste = ocurrencias * fijo + por_km * (ocurrencias * km_primera + periodicidad_km * ocurrencias * (ocurrencias - 1) / 2)
+        acumulado = resultado.setdefault(serie, [0, 0.0])
+        acumulado[0] += ocurrencias
+        acumulado[1] += coste
+    return resultado
+
+class SimuladorCostes():
+    # Proyecta el coste de mantenimiento de la flota para varios escenarios.
+    # Los trenes se reducen a filas de numeros (picklables y baratas de enviar)
+    # y cada escenario se calcula en un proceso del pool. El pool se crea una
+    # vez y se reutiliza, y solo se usa si hay al menos umbral_filas filas
+    # por simular; por debajo, arrancar procesos cuesta mas que calcular.
+
+    umbral_filas: int = 50_000
+
+    def __init__(self, sistema, max_procesos = None, umbral_filas = None):
+        self.sistema: SistemaMantenimiento = sistema
+        self.max_procesos: int = max_procesos
+        if umbral_filas is not None:
+            self.umbral_filas = umbral_filas
+        self.pool: ProcessPoolExecutor = None
+
+    def prepararFilas(self, desde) -> List[tuple]:
+        filas = []
+        for tren in self.sistema.trenes:
+            plan = tren.modelo.plan_mantenimiento if tren.modelo else None
+            if plan is None:
+                continue
+            for tarea in plan.tareas:
+                fijo, por_km = tarea.coeficientesCoste()
+                if isinstance(tarea, TareaPeriodica):
+                    dias = (tarea.proximaFecha(tren) - desde).days
+                    filas.append(("P", tren.numero_serie, fijo, dias, tarea.periodicidad_tiempo / timedelta(days=1)))
+                elif isinstance(tarea, TareaPorRodadura):
+                    ultima = tren.ultima_realizacion.get(tarea)
+                    km_desde = ultima[1] if ultima else tren.kilometraje_inicial
+                    km_restantes = km_desde + tarea.periodicidad_km - tren.kilometraje_total
+                    filas.append(("R", tren.numero_serie, fijo, por_km, tren.kilometraje_total,
+                                  km_restantes, tarea.periodicidad_km, tren.kmDiarios()))
+        return filas
+
+    def simular(self, escenarios, horizonte_dias, desde = None) -> Dict[str, Dict[str, list]]:
+        filas = self.prepararFilas(desde or date.today())
+        factores = [escenario.factor_km for escenario in escenarios]
+        if self.max_procesos == 1 or len(escenarios) <= 1 or len(filas) * len(escenarios) < self.umbral_filas:
+            resultados = [simularEscenario(filas, factor, horizonte_dias) for factor in factores]
+        else:
+            if self.pool is None:
+                self.pool = ProcessPoolExecutor(max_workers=self.max_procesos)
+            resultados = list(self.pool.map(simularEscenario, [filas] * len(factores), factores, [horizonte_dias] * len(factores)))
+        return {escenario.nombre: resultado for escenario, resultado in zip(escenarios, resultados)}
+
+    def cerrar(self) -> None:
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+
+    @staticmethod
+    def costeTotal(resultado) -> float:
+        return sum(coste for _, coste in resultado.values())
+
+if __name__ == "__main__":
+    sistema = SistemaMantenimiento()
+
+    # Crear modelos de trenes
+    modelo_A = Modelo("Modelo A", None)
+    modelo_B = Modelo("Modelo B", None)
+
+    # Crear planes de mantenimiento y asignarlos a los modelos
+    plan_A = PlanMantenimiento("V1.0")
+    plan_B = PlanMantenimiento("V2.0")
+
+    sistema.registrarPlanMantenimiento(plan_A)
+    sistema.registrarPlanMantenimiento(plan_B)
+
+    plan_A.agregarModelo(modelo_A)
+    plan_B.agregarModelo(modelo_B)
+
+    modelo_A.asignarPlanMantenimiento(plan_A)
+    modelo_B.asignarPlanMantenimiento(plan_B)
+
+    # Crear repuestos
+    repuesto1 = Repuesto("Filtro de aire", 50.0)
+    repuesto2 = Repuesto("Aceite lubricante", 30.0)
+
+    # Agregar tareas periódicas y por rodadura a los planes de mantenimiento
+    tarea1 = TareaPeriodica("TP-001", timedelta(hours=2), 200.0, [repuesto1], timedelta(days=30))
+    tarea2 = TareaPorRodadura("TR-001", timedelta(hours=3), 150.0, [repuesto2], 10000)
+
+    plan_A.agregarTarea(tarea1)
+    plan_A.agregarTarea(tarea2)
+
+    # Registrar trenes en el sistema
+    tren_1 = Tren("12345A", modelo_A, "MarcaX", date(2022, 5, 10), 5000)
+    tren_2 = Tren("67890B", modelo_B, "MarcaY", date(2021, 8, 15), 20000)
+
+    sistema.registrarTren(tren_1)
+    sistema.registrarTren(tren_2)
+
+    # Registrar viajes de trenes
+    viaje_1 = Viaje(datetime.datetime(2024, 2, 10, 10, 0), 1200)
+    viaje_2 = Viaje(datetime.datetime(2024, 2, 15, 14, 30), 800)
+
+    tren_1.registrarViaje(viaje_1)
+    tren_1.registrarViaje(viaje_2)
+
+    # Registrar tareas realizadas en un tren
+    tarea_realizada_1 = TareaRealizada(tarea1, date(2024, 2, 28), "Cambio de filtro de aire")
+    tarea_realizada_2 = TareaRealizada(tarea2, date(2024, 2, 28), "Cambio de aceite por rodadura")
+
+    tren_1.registrarTareaRealizada(tarea_realizada_1)
+    tren_1.registrarTareaRealizada(tarea_realizada_2)
+
+    # Obtener costo de tareas realizadas en febrero 2024
+    costo_febrero = sistema.obtenerCostoTareasPorMes(tren_1, 2024, 2)
+    print(f"\n💰 Costo total de tareas realizadas en febrero 2024 para el tren {tren_1.numero_serie}: ${costo_febrero:.2f}\n")
+
+    # Obtener los 5 planes de mantenimiento más costosos
+    sistema.obtenerPlanesMantenimientoMasCostosos()
\ No newline at end of file
@@ -0,0 +1,95 @@
+from datetime import date, timedelta
+
+from mdss.kanban import Lista, Persona, Sistema, TareaDIU, TareaProgramacion
+
+
+def crear_sistema():
+    sistema = Sistema()
+    tablero = sistema.crear_tablero("Proyecto", Persona("Lider", "lider@example.com"))
+    tablero.agregar_lista(Lista("En curso"))
+    return sistema, tablero
+
+
+def nueva_tarea(titulo, dias_atras=0):
+    tarea = TareaProgramacion(titulo, "-", 2, date.today() + timedelta(days=30))
+    tarea.fecha_creacion = date.today() - timedelta(days=dias_atras)
+    return tarea
+
+
+def test_indices_siguen_a_lista_y_tablero():
+    sistema, tablero = crear_sistema()
+    dev = Persona("Dev", "dev@example.com")
+    por_tablero = sistema.crear_tarea(tablero, "por sistema", "-", 2, date.today(), "DIU")
+    por_lista = nueva_tarea("por lista")
+    por_lista.asignar(dev)
+    tablero.listas["En curso"].agregar_tarea(por_lista)
+    agregada = nueva_tarea("por tablero")
+    tablero.agregar_tarea_a_lista("En curso", agregada)
+
+    assert sistema.listar_tareas_pendientes() == [por_tablero, por_lista, agregada]
+    assert sistema.listar_tareas_usuario(dev) == [por_lista]
+
+    # Mover entre listas no cambia el orden; quitar por Lista o por Tablero
+    # saca la tarea de ambos indices.
+    assert tablero.mover_tarea(por_lista, "Backlog")
+    assert sistema.listar_tareas_pendientes() == [por_tablero, por_lista, agregada]
+    tablero.listas["Backlog"].remover_tarea(por_lista)
+    assert sistema.listar_tareas_pendientes() == [por_tablero, agregada]
+    assert sistema.listar_tareas_usuario(dev) == []
+    tablero.remover_tarea(agregada)
+    assert sistema.listar_tareas_pendientes() == [por_tablero]
+
+    # Cerrar directamente sobre la tarea tambien la saca de pendientes.
+    por_tablero.cerrar()
+    assert sistema.listar_tareas_pendientes() == []
+
+
+def test_asignar_directo_y_cerradas_que_llegan():
+    sistema, tablero = crear_sistema()
+    dev = Persona("Dev", "dev@example.com")
+    abierta = nueva_tarea("abierta")
+    cerrada = nueva_tarea("cerrada")
+    cerrada.cerrar()
+    lista = Lista("Hecho")
+    lista.agregar_tarea(abierta)
+    lista.agregar_tarea(cerrada)
+    tablero.agregar_lista(lista)
+    abierta.asignar(dev)
+
+    assert sistema.listar_tareas_pendientes() == [abierta]
+    assert sistema.listar_tareas_usuario(dev) == [abierta]
+
+
+def test_paginas_por_cursor_en_orden_de_creacion():
+    sistema, tablero = crear_sistema()
+    tareas = [nueva_tarea(f"t{i}", dias_atras=10 - i) for i in range(10)]
+    for tarea in reversed(tareas):
+        tablero.agregar_tarea_a_lista("Backlog", tarea)
+
+    paginas = []
+    cursor = None
+    while True:
+        pagina = sistema.listar_tareas_pendientes(cursor, 3)
+        if not pagina:
+            break
+        paginas.append(pagina)
+        cursor = pagina[-1]
+    assert [tarea for pagina in paginas for tarea in pagina] == tareas
+    assert [len(pagina) for pagina in paginas] == [3, 3, 3, 1]
+
+    # Un cursor que ya no esta en el indice sigue marcando la posicion.
+    tablero.remover_tarea(tareas[2])
+    assert sistema.listar_tareas_pendientes(tareas[2], 2) == tareas[3:5]
+
+
+def test_mover_tarea_entre_tableros():
+    sistema, origen = crear_sistema()
+    destino = sistema.crear_tablero("Otro", Persona("Otra", "otra@example.com"))
+    tarea = TareaDIU("viajera", "-", 1, date.today())
+    origen.agregar_tarea_a_lista("Backlog", tarea)
+    destino.listas["Backlog"].agregar_tarea(tarea)
+
+    assert tarea not in origen.listas["Backlog"]
+    assert origen.lista_de(tarea) is None
+    assert destino.lista_de(tarea) is destino.listas["Backlog"]
+    assert sistema.listar_tareas_pendientes() == [tarea]